@@ -0,0 +1,61 @@
+"""Import time of the package, checked against a budget.
+
+Usage: python benchmarks/imports.py [--budget MS] [--runs N]
+
+Each run imports the module in a fresh interpreter. Exits with an error
+if the median import time exceeds the budget, in milliseconds.
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+
+PROBE = '''
+import sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+heavy = [name for name in ('deform', 'numpy', 'concurrent.futures')
+         if name in sys.modules]
+print(elapsed, ','.join(heavy))
+'''
+
+
+def measure(module: str, runs: int) -> dict:
+    timings = []
+    loaded = set()
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, '-c', PROBE.format(module=module)],
+            check=True, capture_output=True, text=True
+        ).stdout.split()
+        timings.append(float(output[0]) * 1000)
+        if len(output) > 1:
+            loaded.update(output[1].split(','))
+    return {
+        'module': module,
+        'median_ms': round(statistics.median(timings), 2),
+        'min_ms': round(min(timings), 2),
+        'heavy_modules': sorted(loaded),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--module', default='jsonschema_colander.types')
+    parser.add_argument('--budget', type=float, default=250.0)
+    parser.add_argument('--runs', type=int, default=7)
+    args = parser.parse_args(argv)
+
+    result = measure(args.module, args.runs)
+    result['budget_ms'] = args.budget
+    json.dump(result, sys.stdout, indent=2)
+    print()
+    if result['median_ms'] > args.budget:
+        sys.exit(f'Import budget exceeded: {result["median_ms"]} ms.')
+
+
+if __name__ == '__main__':
+    main()
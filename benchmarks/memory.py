@@ -0,0 +1,40 @@
+"""Memory used per compiled field.
+
+Usage: python benchmarks/memory.py [properties]
+"""
+import gc
+import sys
+import tracemalloc
+from jsonschema_colander.types import Object
+from schemas import wide
+
+
+def count_fields(field) -> int:
+    count = 1
+    for subfield in (getattr(field, 'fields', None) or {}).values():
+        count += count_fields(subfield)
+    if (subfield := getattr(field, 'subfield', None)) is not None:
+        count += count_fields(subfield)
+    return count
+
+
+def measure(size: int) -> dict:
+    schema, _ = wide(size)
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    field = Object.from_json(schema, config={'readonly': False})
+    gc.collect()
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    fields = count_fields(field)
+    return {
+        'fields': fields,
+        'bytes': used,
+        'bytes_per_field': round(used / fields, 1),
+    }
+
+
+if __name__ == '__main__':
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 3000
+    print(measure(size))
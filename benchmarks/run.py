@@ -0,0 +1,141 @@
+"""Benchmarks of the compile, build, bind and deserialize hot paths.
+
+Usage: python benchmarks/run.py [--scale N] [--output results.json]
+                                [--compare baseline.json]
+
+Each scenario reports, per phase, the time of one operation, the
+throughput and the peak memory allocated while running it once.
+Results are written as JSON, to be compared between releases.
+"""
+import argparse
+import gc
+import json
+import platform
+import sys
+import time
+import timeit
+import tracemalloc
+import typing as t
+from importlib import metadata
+
+import schemas
+from jsonschema_colander.converter import converter
+from jsonschema_colander import types  # noqa: F401 (registers the converters)
+
+
+SCENARIOS = {
+    'wide': (schemas.wide, 1000, {}),
+    'deep': (schemas.deep, 50, {}),
+    'refs': (schemas.refs, 500, {}),
+    'enum': (schemas.enum, 20000, {}),
+    'arrays': (schemas.arrays, 100000, {}),
+    'arrays-vectorized': (
+        schemas.arrays, 100000,
+        {'vectorize': True, 'readings': {'storage': 'array'}}
+    ),
+}
+
+
+def phases(schema: dict, cstruct: dict, config: dict) -> t.Dict[str, t.Callable]:
+    def compile():
+        return converter.dispatch(schema).from_json(
+            schema, name='', config=config)
+
+    field = compile()
+    node = field()
+    deserializer = field.get_deserializer()
+    return {
+        'compile': compile,
+        'build': field,
+        'bind': lambda: field.bind(data=cstruct),
+        'deserialize': lambda: node.deserialize(cstruct),
+        'compiled_deserialize': lambda: deserializer(cstruct),
+    }
+
+
+def measure(func: t.Callable, repeat: int) -> dict:
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    seconds = min(timer.repeat(repeat=repeat, number=number)) / number
+
+    gc.collect()
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {
+        'seconds': seconds,
+        'ops_per_second': round(1 / seconds, 2),
+        'peak_bytes': peak,
+    }
+
+
+def run(scale: float = 1.0, repeat: int = 3,
+        only: t.Optional[t.Sequence[str]] = None) -> dict:
+    results = {}
+    for name, (generator, size, config) in SCENARIOS.items():
+        if only and name not in only:
+            continue
+        size = max(1, int(size * scale))
+        schema, cstruct = generator(size)
+        results[name] = {
+            'size': size,
+            'phases': {
+                phase: measure(func, repeat)
+                for phase, func in phases(schema, cstruct, config).items()
+            }
+        }
+    return {
+        'meta': {
+            'version': metadata.version('jsonschema_colander'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'date': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+            'scale': scale,
+        },
+        'results': results,
+    }
+
+
+def compare(baseline: dict, current: dict) -> t.Iterator[str]:
+    """Yields a line per phase: the time ratio against the baseline."""
+    yield f'{"scenario":<20}{"phase":<22}{"time":>8}{"memory":>8}'
+    for name, result in current['results'].items():
+        if (before := baseline['results'].get(name)) is None:
+            continue
+        if before['size'] != result['size']:
+            continue  # Not comparable.
+        for phase, values in result['phases'].items():
+            if (old := before['phases'].get(phase)) is None:
+                continue
+            time_ratio = values['seconds'] / old['seconds']
+            memory_ratio = values['peak_bytes'] / max(old['peak_bytes'], 1)
+            yield f'{name:<20}{phase:<22}{time_ratio:>8.2f}{memory_ratio:>8.2f}'
+
+
+def main(argv: t.Optional[t.Sequence[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--scale', type=float, default=1.0,
+                        help='Multiplies the size of the schemas.')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--only', nargs='*', choices=list(SCENARIOS))
+    parser.add_argument('--output', help='Writes the results to this file.')
+    parser.add_argument('--compare', help='Baseline results file.')
+    args = parser.parse_args(argv)
+
+    results = run(args.scale, args.repeat, args.only)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+    else:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        for line in compare(baseline, results):
+            print(line, file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+"""Synthetic schemas of growing size, with a valid cstruct for each.
+
+Every generator returns a `(schema, cstruct)` tuple.
+"""
+import typing as t
+
+
+Sample = t.Tuple[dict, dict]
+
+
+def wide(size: int) -> Sample:
+    """An object with `size` properties of mixed types."""
+    properties = {}
+    cstruct = {}
+    for i in range(size):
+        if i % 3 == 0:
+            properties[f'string{i}'] = {"type": "string", "maxLength": 20}
+            cstruct[f'string{i}'] = f'value {i}'
+        elif i % 3 == 1:
+            properties[f'number{i}'] = {"type": "integer", "minimum": 0}
+            cstruct[f'number{i}'] = str(i)
+        else:
+            properties[f'object{i}'] = {
+                "type": "object",
+                "properties": {
+                    "flag": {"type": "boolean"},
+                    "tags": {"type": "array", "items": {"type": "string"}},
+                }
+            }
+            cstruct[f'object{i}'] = {'flag': 'true', 'tags': ['a', 'b']}
+    return {"type": "object", "properties": properties}, cstruct
+
+
+def deep(depth: int) -> Sample:
+    """Objects nested `depth` levels deep."""
+    schema = {"type": "object", "properties": {"value": {"type": "string"}}}
+    cstruct = {'value': 'leaf'}
+    for level in range(depth - 1):
+        schema = {
+            "type": "object",
+            "properties": {
+                "value": {"type": "string"},
+                "child": schema,
+            }
+        }
+        cstruct = {'value': f'level {level}', 'child': cstruct}
+    return schema, cstruct
+
+
+def refs(size: int) -> Sample:
+    """An object with `size` properties referencing 10 definitions."""
+    definitions = {
+        f'address{i}': {
+            "type": "object",
+            "properties": {
+                "street": {"type": "string"},
+                "city": {"type": "string"},
+                "zip": {"type": "string", "pattern": "^[0-9]{5}$"},
+            },
+            "required": ["city"],
+        }
+        for i in range(10)
+    }
+    properties = {}
+    cstruct = {}
+    for i in range(size):
+        properties[f'address{i}'] = {"$ref": f"#/definitions/address{i % 10}"}
+        cstruct[f'address{i}'] = {
+            'street': 'Main street', 'city': 'Town', 'zip': '12345'
+        }
+    return {
+        "type": "object",
+        "definitions": definitions,
+        "properties": properties,
+    }, cstruct
+
+
+def enum(size: int) -> Sample:
+    """String and number enums of `size` values."""
+    return {
+        "type": "object",
+        "properties": {
+            "code": {
+                "type": "string",
+                "enum": [f'CODE{i:06d}' for i in range(size)]
+            },
+            "number": {"type": "integer", "enum": list(range(size))},
+        }
+    }, {'code': f'CODE{size - 1:06d}', 'number': str(size - 1)}
+
+
+def arrays(length: int) -> Sample:
+    """An array of `length` bounded numbers."""
+    return {
+        "type": "object",
+        "properties": {
+            "readings": {
+                "type": "array",
+                "items": {"type": "number", "minimum": -1e6, "maximum": 1e6},
+            }
+        }
+    }, {'readings': [str(i / 7) for i in range(length)]}
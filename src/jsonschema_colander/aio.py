@@ -0,0 +1,104 @@
+import asyncio
+import json
+import os
+import typing as t
+from concurrent.futures import Executor
+from functools import partial
+from .cache import CompileCache, UnstableKey, compile_cache
+from .meta import JSONField
+
+
+class AsyncLoader:
+    """Loads and compiles schemas in an executor, off the event loop.
+
+    Compiled fields are stored in the compile cache. Concurrent requests
+    for the same schema and options share a single compilation.
+    """
+
+    def __init__(self,
+                 cache: CompileCache = compile_cache,
+                 executor: t.Optional[Executor] = None):
+        self.cache = cache
+        self.executor = executor
+        self.inflight: t.Dict[t.Tuple, asyncio.Future] = {}
+
+    def key(self, schema: t.Mapping,
+            config: t.Optional[t.Mapping] = None,
+            *, name: t.Optional[str] = None,
+            required: bool = False) -> t.Optional[str]:
+        """Returns the cache key, or None if the schema is not cached."""
+        try:
+            return self.cache.key(
+                schema, config, name=name, required=required)
+        except UnstableKey:
+            return None
+
+    async def compile(self, schema: t.Mapping,
+                      config: t.Optional[t.Mapping] = None,
+                      *, name: t.Optional[str] = None,
+                      required: bool = False,
+                      build: bool = False,
+                      key: t.Optional[str] = None) -> JSONField:
+        """Returns the compiled field, from the cache if possible.
+        With `build`, the node tree and deserializer are built in the
+        executor too.
+
+        The cache key hashes the whole schema: it is computed in the
+        executor, unless given (see `CompileCache.key`).
+        """
+        loop = asyncio.get_running_loop()
+        if key is None:
+            key = await loop.run_in_executor(self.executor, partial(
+                self.key, schema, config, name=name, required=required
+            ))
+        if key is None:
+            # Not cached: nothing to share.
+            field = await loop.run_in_executor(self.executor, partial(
+                self.cache.compile, schema, config,
+                name=name, required=required
+            ))
+        elif (field := self.cache.get(key)) is None:
+            inflight = (loop, key)
+            if (future := self.inflight.get(inflight)) is None:
+                future = self.inflight[inflight] = loop.run_in_executor(
+                    self.executor, partial(
+                        self.cache.compile, schema, config,
+                        name=name, required=required, key=key
+                    )
+                )
+                future.add_done_callback(
+                    lambda _: self.inflight.pop(inflight, None))
+            # A cancelled caller does not cancel the shared compilation.
+            field = await asyncio.shield(future)
+        if build and field._deserializer is None:
+            await loop.run_in_executor(self.executor, field.get_deserializer)
+        return field
+
+    async def loads(self, document: t.Union[str, bytes],
+                    config: t.Optional[t.Mapping] = None,
+                    **kwargs) -> JSONField:
+        """Parses the JSON schema document in the executor, then compiles
+        it, see `compile`.
+        """
+        loop = asyncio.get_running_loop()
+        schema = await loop.run_in_executor(
+            self.executor, json.loads, document)
+        return await self.compile(schema, config, **kwargs)
+
+    async def load(self, path: t.Union[str, os.PathLike],
+                   config: t.Optional[t.Mapping] = None,
+                   **kwargs) -> JSONField:
+        """Reads and parses the JSON schema file in the executor, then
+        compiles it, see `compile`.
+        """
+        loop = asyncio.get_running_loop()
+        schema = await loop.run_in_executor(self.executor, read, path)
+        return await self.compile(schema, config, **kwargs)
+
+
+def read(path: t.Union[str, os.PathLike]) -> t.Any:
+    with open(path, 'rb') as f:
+        return json.load(f)
+
+
+loader = AsyncLoader()
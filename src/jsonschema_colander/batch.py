@@ -0,0 +1,90 @@
+import colander
+import itertools
+import typing as t
+from collections import namedtuple
+from .compiler import compile_deserializer
+from .meta import JSONField
+
+
+BatchResult = namedtuple('BatchResult', ['appstruct', 'errors'])
+
+BACKENDS = ('serial', 'thread', 'process')
+
+_deserializer: t.Optional[t.Callable] = None  # process worker state
+
+
+def get_deserializer(field: JSONField,
+                     bind: t.Optional[t.Mapping] = None) -> t.Callable:
+    if bind is None:
+        return field.get_deserializer()
+    return compile_deserializer(field.get_node().bind(**bind))
+
+
+def validate(deserializer: t.Callable, cstruct: t.Any) -> BatchResult:
+    try:
+        return BatchResult(deserializer(cstruct), None)
+    except colander.Invalid as exc:
+        return BatchResult(None, exc.asdict())
+
+
+def validate_chunk(deserializer: t.Callable,
+                   chunk: t.Sequence) -> t.List[BatchResult]:
+    return [validate(deserializer, cstruct) for cstruct in chunk]
+
+
+def _initialize_worker(field: JSONField, bind: t.Optional[t.Mapping]):
+    global _deserializer
+    _deserializer = get_deserializer(field, bind)
+
+
+def _validate_chunk_in_worker(chunk: t.Sequence) -> t.List[BatchResult]:
+    return validate_chunk(_deserializer, chunk)
+
+
+def chunked(iterable: t.Iterable, size: int) -> t.Iterator[t.List]:
+    iterator = iter(iterable)
+    while chunk := list(itertools.islice(iterator, size)):
+        yield chunk
+
+
+def validate_batch(field: JSONField,
+                   cstructs: t.Iterable,
+                   *,
+                   backend: str = 'serial',
+                   max_workers: t.Optional[int] = None,
+                   chunksize: int = 256,
+                   bind: t.Optional[t.Mapping] = None
+                   ) -> t.List[BatchResult]:
+    """Deserializes each cstruct with the field, returning a result per
+    cstruct, in input order: the appstruct, or the errors as returned
+    by `colander.Invalid.asdict`.
+
+    The `thread` and `process` backends validate chunks of `chunksize`
+    cstructs in a pool of `max_workers`. The `process` backend pickles
+    the field to its workers: configured validators must be picklable.
+    If `bind` is given, the node is bound with it before validation.
+    """
+    if backend not in BACKENDS:
+        raise ValueError(
+            f'Unknown backend {backend!r}, expected one of {BACKENDS}.')
+
+    if backend == 'serial':
+        return validate_chunk(get_deserializer(field, bind), cstructs)
+
+    # Pools are only imported when used, they are slow to import.
+    from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+    chunks = chunked(cstructs, chunksize)
+    if backend == 'thread':
+        deserializer = get_deserializer(field, bind)
+        with ThreadPoolExecutor(max_workers) as executor:
+            results = executor.map(
+                lambda chunk: validate_chunk(deserializer, chunk), chunks)
+            return list(itertools.chain.from_iterable(results))
+
+    with ProcessPoolExecutor(
+            max_workers,
+            initializer=_initialize_worker,
+            initargs=(field, bind)) as executor:
+        results = executor.map(_validate_chunk_in_worker, chunks)
+        return list(itertools.chain.from_iterable(results))
@@ -0,0 +1,162 @@
+import json
+import hashlib
+import threading
+import typing as t
+from collections import OrderedDict
+from collections.abc import Mapping
+from types import ModuleType
+from .converter import converter
+from .pool import CacheInfo
+from . import types  # noqa: F401 (registers the converters)
+
+
+class UnstableKey(TypeError):
+    """Raised for values without a stable key: instances, lambdas,
+    closures and bound methods.
+    """
+
+
+def _default(value):
+    if isinstance(value, Mapping):
+        return dict(value)
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=canonical)
+    qualname = getattr(value, '__qualname__', None)
+    bound = getattr(value, '__self__', None)
+    if isinstance(qualname, str) and '<' not in qualname and (
+            bound is None or isinstance(bound, (type, ModuleType))):
+        # Classes and module level functions are named.
+        return f'{value.__module__}.{qualname}'
+    raise UnstableKey(f'No stable key for {value!r}.')
+
+
+def canonical(value: t.Any) -> str:
+    """Stable JSON serialization: sorted keys, no whitespace.
+    Raises `UnstableKey` for values that cannot be named.
+    """
+    return json.dumps(
+        value, sort_keys=True, separators=(',', ':'), default=_default)
+
+
+def ordered(schema: t.Any) -> t.Any:
+    """Returns the schema with its `properties` as lists of
+    `[name, schema]` pairs: their order is the order of the fields.
+    """
+    if isinstance(schema, Mapping):
+        return {
+            key: [[name, ordered(value)] for name, value in item.items()]
+            if key == 'properties' and isinstance(item, Mapping)
+            else ordered(item)
+            for key, item in schema.items()
+        }
+    if isinstance(schema, (list, tuple)):
+        return [ordered(item) for item in schema]
+    return schema
+
+
+def fingerprint(schema: t.Mapping, config: t.Optional[t.Mapping] = None,
+                **kwargs) -> str:
+    """Content hash of a schema and the options used to compile it.
+    Keys are sorted, except property names, kept in order.
+    """
+    return hashlib.sha256(
+        canonical([ordered(schema), config or {}, kwargs]).encode('utf-8')
+    ).hexdigest()
+
+
+class CompileCache:
+    """LRU cache of compiled fields, keyed on the schema fingerprint.
+
+    Schemas configured with values that have no stable key (validator
+    instances, lambdas...) are compiled but not cached, unless the
+    caller provides the key.
+    """
+
+    def __init__(self, maxsize: int = 128):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key: str):
+        return key in self._entries
+
+    def key(self, schema: t.Mapping, config: t.Optional[t.Mapping] = None,
+            *, name: t.Optional[str] = None, required: bool = False) -> str:
+        return fingerprint(schema, config, name=name, required=required)
+
+    def peek(self, key: str):
+        """Returns the cached field, without counting the lookup."""
+        with self._lock:
+            if (field := self._entries.get(key)) is not None:
+                self._entries.move_to_end(key)
+            return field
+
+    def get(self, key: str):
+        with self._lock:
+            if (field := self._entries.get(key)) is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return field
+
+    def set(self, key: str, field):
+        with self._lock:
+            self._entries[key] = field
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def compile(self, schema: t.Mapping,
+                config: t.Optional[t.Mapping] = None,
+                *, name: t.Optional[str] = None, required: bool = False,
+                key: t.Optional[str] = None):
+        """Returns the compiled field for the schema, compiling it
+        only if no equal schema was compiled with the same options.
+        `key` is the precomputed `CompileCache.key` of the arguments,
+        already looked up by the caller: the lookup is not counted again.
+        """
+        if key is None:
+            try:
+                key = self.key(schema, config, name=name, required=required)
+            except UnstableKey:
+                return converter.dispatch(schema).from_json(
+                    schema, name=name, config=config, required=required
+                )
+            field = self.get(key)
+        else:
+            field = self.peek(key)
+        if field is not None:
+            return field
+        field = converter.dispatch(schema).from_json(
+            schema, name=name, config=config, required=required
+        )
+        self.set(key, field)
+        return field
+
+    def invalidate(self, schema: t.Mapping,
+                   config: t.Optional[t.Mapping] = None,
+                   *, name: t.Optional[str] = None,
+                   required: bool = False) -> bool:
+        try:
+            key = self.key(schema, config, name=name, required=required)
+        except UnstableKey:
+            return False
+        with self._lock:
+            return self._entries.pop(key, None) is not None
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def cache_info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self))
+
+
+compile_cache = CompileCache()
@@ -0,0 +1,209 @@
+import copy
+import itertools
+import colander
+import typing as t
+
+
+NAMESPACE = {
+    'null': colander.null,
+    'drop': colander.drop,
+    'Invalid': colander.Invalid,
+    'UnsupportedFields': colander.UnsupportedFields,
+    '_': colander._,
+    'deepcopy': copy.deepcopy,
+}
+
+
+def is_compilable(node: colander.SchemaNode) -> bool:
+    """Nodes with a custom deserialization or unbound deferred values
+    are left to colander.
+    """
+    return (
+        type(node).deserialize is colander.SchemaNode.deserialize
+        and not isinstance(node.validator, colander.deferred)
+        and not isinstance(node.preparer, colander.deferred)
+    )
+
+
+def is_container(node: colander.SchemaNode) -> bool:
+    return type(node.typ) in (colander.Mapping, colander.Sequence)
+
+
+class Generator:
+    """Generates the source of a deserializer, mirroring
+    `colander.SchemaNode.deserialize` with the node values inlined.
+
+    Mappings and sequences get a function of their own, scalar nodes
+    are inlined in their container's function.
+    """
+
+    def __init__(self):
+        self.functions = []
+        self.namespace = dict(NAMESPACE)
+        self.counter = itertools.count()
+
+    @property
+    def source(self) -> str:
+        return '\n\n'.join(self.functions)
+
+    def constant(self, prefix: str, value: t.Any) -> str:
+        name = f'{prefix}{next(self.counter)}'
+        self.namespace[name] = value
+        return name
+
+    def function(self, node: colander.SchemaNode) -> str:
+        name = f'deserialize{next(self.counter)}'
+        lines = [f'def {name}(cstruct=null):']
+        self.node(node, 'cstruct', 'appstruct', lines, 1)
+        lines.append('    return appstruct')
+        self.functions.append('\n'.join(lines))
+        return name
+
+    def node(self, node, src: str, dst: str, lines: t.List[str], indent: int):
+        def emit(level, line):
+            lines.append('    ' * (indent + level) + line)
+
+        n = self.constant('node', node)
+        if not is_compilable(node):
+            emit(0, f'{dst} = {n}.deserialize({src})')
+            return
+        if is_container(node) and indent > 1:
+            emit(0, f'{dst} = {self.function(node)}({src})')
+            return
+
+        if type(node.typ) is colander.Mapping:
+            self.mapping(node, n, src, dst, lines, indent)
+        elif type(node.typ) is colander.Sequence:
+            self.sequence(node, n, src, dst, lines, indent)
+        else:
+            typ = self.constant('typ', node.typ)
+            emit(0, f'{dst} = {typ}.deserialize({n}, {src})')
+
+        if (preparers := node.preparer) is not None:
+            if callable(preparers):
+                preparers = [preparers]
+            for preparer in preparers:
+                emit(0, f'{dst} = {self.constant("preparer", preparer)}({dst})')
+
+        emit(0, f'if {dst} is null:')
+        missing = node.missing
+        if missing is colander.required:
+            emit(1, (
+                f'raise Invalid({n}, _({n}.missing_msg, mapping='
+                f'{{"title": {n}.title, "name": {n}.name}}))'
+            ))
+        elif isinstance(missing, colander.deferred):
+            emit(1, f'raise Invalid({n}, {n}.missing_msg)')
+        else:
+            emit(1, f'{dst} = {self.constant("missing", missing)}')
+        if node.validator is not None:
+            emit(0, 'else:')
+            emit(1, f'{self.constant("validator", node.validator)}({n}, {dst})')
+
+    def child(self, subnode, sub: str, n: str, error: str, pos: str,
+              store: str, lines: t.List[str], indent: int):
+        """Deserializes a child value as the colander container types do:
+        errors are collected, dropped values are skipped.
+        """
+        def emit(level, line):
+            lines.append('    ' * (indent + level) + line)
+
+        k = next(self.counter)
+        result = f'result{k}'
+        emit(0, 'try:')
+        self.node(subnode, sub, result, lines, indent + 1)
+        emit(0, f'except Invalid as exc{k}:')
+        emit(1, f'if {error} is None:')
+        emit(2, f'{error} = Invalid({n})')
+        emit(1, f'{error}.add(exc{k}, {pos})')
+        emit(0, 'else:')
+        emit(1, f'if {result} is not drop:')
+        emit(2, store.format(result))
+
+    def mapping(self, node, n: str, src: str, dst: str,
+                lines: t.List[str], indent: int):
+        def emit(level, line):
+            lines.append('    ' * (indent + level) + line)
+
+        typ = self.constant('typ', node.typ)
+        k = next(self.counter)
+        value, error, result = f'value{k}', f'error{k}', f'mapping{k}'
+        emit(0, f'if {src} is null:')
+        emit(1, f'{dst} = null')
+        emit(0, 'else:')
+        emit(1, f'{value} = {typ}._validate({n}, {src})')
+        emit(1, f'{error} = None')
+        emit(1, f'{result} = {{}}')
+        for num, subnode in enumerate(node.children):
+            sub = f'sub{next(self.counter)}'
+            emit(1, f'{sub} = {value}.pop({subnode.name!r}, null)')
+            skip = f'{sub} is drop'
+            if getattr(subnode, 'missing', None) is colander.drop:
+                skip += f' or {sub} is null'
+            emit(1, f'if not ({skip}):')
+            self.child(
+                subnode, sub, n, error, str(num),
+                f'{result}[{subnode.name!r}] = {{}}', lines, indent + 2
+            )
+        unknown = node.typ.unknown
+        if unknown == 'raise':
+            emit(1, f'if {value}:')
+            emit(2, (
+                f'raise UnsupportedFields({n}, {value}, msg=_('
+                f'\'Unrecognized keys in mapping: "${{val}}"\', '
+                f'mapping={{"val": {value}}}))'
+            ))
+        elif unknown == 'preserve':
+            emit(1, f'{result}.update(deepcopy({value}))')
+        emit(1, f'if {error} is not None:')
+        emit(2, f'raise {error}')
+        emit(1, f'{dst} = {result}')
+
+    def sequence(self, node, n: str, src: str, dst: str,
+                 lines: t.List[str], indent: int):
+        def emit(level, line):
+            lines.append('    ' * (indent + level) + line)
+
+        typ = self.constant('typ', node.typ)
+        k = next(self.counter)
+        items, error, result = f'items{k}', f'error{k}', f'sequence{k}'
+        num, sub = f'num{k}', f'sub{k}'
+        subnode = node.children[0]
+        emit(0, f'if {src} is null:')
+        emit(1, f'{dst} = null')
+        emit(0, 'else:')
+        emit(1, (
+            f'{items} = {typ}._validate({n}, {src}, '
+            f'{node.typ.accept_scalar!r})'
+        ))
+        emit(1, f'{error} = None')
+        emit(1, f'{result} = []')
+        emit(1, f'for {num}, {sub} in enumerate({items}):')
+        skip = f'{sub} is drop'
+        if getattr(subnode, 'missing', None) is colander.drop:
+            skip += f' or {sub} is null'
+        emit(2, f'if {skip}:')
+        emit(3, 'continue')
+        self.child(
+            subnode, sub, n, error, num, f'{result}.append({{}})',
+            lines, indent + 2
+        )
+        emit(1, f'if {error} is not None:')
+        emit(2, f'raise {error}')
+        emit(1, f'{dst} = {result}')
+
+
+def compile_deserializer(
+        node: colander.SchemaNode) -> t.Callable[[t.Any], t.Any]:
+    """Returns a function deserializing a cstruct like `node.deserialize`,
+    with the same results and errors.
+
+    The node values are read once, at generation: the node must not be
+    altered afterwards. Unbound deferred `missing` values raise like an
+    unbound colander node: bind the node before compiling it.
+    """
+    generator = Generator()
+    name = generator.function(node)
+    code = compile(generator.source, f'<deserializer {node.name!r}>', 'exec')
+    exec(code, generator.namespace)
+    return generator.namespace[name]
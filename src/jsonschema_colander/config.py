@@ -0,0 +1,121 @@
+import collections.abc
+import fnmatch
+import itertools
+import typing as t
+from types import MappingProxyType
+
+
+EMPTY = MappingProxyType({})
+
+WILDCARDS = frozenset('*?[')
+
+
+class PatternNode:
+    """Node of the pattern trie, one level per path fragment."""
+
+    __slots__ = ('literals', 'globs', 'globstar', 'entries')
+
+    def __init__(self):
+        self.literals = {}
+        self.globs = {}
+        self.globstar = None
+        self.entries = []
+
+    def add(self, fragments: t.Sequence[str], entry: t.Tuple):
+        node = self
+        for fragment in fragments:
+            if fragment == '**':
+                if node.globstar is None:
+                    node.globstar = PatternNode()
+                node = node.globstar
+            elif WILDCARDS & set(fragment):
+                node = node.globs.setdefault(fragment, PatternNode())
+            else:
+                node = node.literals.setdefault(fragment, PatternNode())
+        node.entries.append(entry)
+
+    def match(self, fragments: t.Sequence[str], index: int, found: t.List):
+        if self.globstar is not None:
+            for position in range(index, len(fragments) + 1):
+                self.globstar.match(fragments, position, found)
+        if index == len(fragments):
+            found.extend(self.entries)
+            return
+        fragment = fragments[index]
+        if (node := self.literals.get(fragment)) is not None:
+            node.match(fragments, index + 1, found)
+        for pattern, node in self.globs.items():
+            if fnmatch.fnmatchcase(fragment, pattern):
+                node.match(fragments, index + 1, found)
+
+
+class Configuration(collections.abc.Mapping):
+    """Read-only configuration of a schema compilation.
+
+    Keys are global options (`readonly`, `lazy`, `max_depth`...) or
+    dotted field paths. Path keys may be glob patterns, matched fragment
+    by fragment: `*` matches one fragment, `**` any number of them.
+
+    The configuration of a field merges the matching patterns, from the
+    least to the most specific, then the exact path entry. It is merged
+    once per path.
+    """
+
+    __slots__ = ('data', 'patterns', 'fieldconfs')
+
+    def __init__(self, data: t.Optional[t.Mapping] = None):
+        self.data = dict(data or {})
+        self.patterns = PatternNode()
+        self.fieldconfs = {}
+        order = itertools.count()
+        for key, value in self.data.items():
+            if isinstance(value, t.Mapping) and WILDCARDS & set(key):
+                fragments = key.split('.')
+                specificity = sum(
+                    not (WILDCARDS & set(fragment)) for fragment in fragments)
+                self.patterns.add(fragments, (specificity, next(order), value))
+
+    @classmethod
+    def of(cls, config: t.Optional[t.Mapping]) -> 'Configuration':
+        if isinstance(config, cls):
+            return config
+        return cls(config)
+
+    def __reduce__(self):
+        return (self.__class__, (self.data,))
+
+    def __getitem__(self, key: str):
+        return self.data[key]
+
+    def __iter__(self):
+        return iter(self.data)
+
+    def __len__(self):
+        return len(self.data)
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self.data!r})'
+
+    def fieldconf(self, path: str) -> t.Mapping:
+        """Returns the merged configuration of the field at `path`."""
+        if (fieldconf := self.fieldconfs.get(path)) is not None:
+            return fieldconf
+
+        found = []
+        self.patterns.match(path.split('.'), 0, found)
+        exact = self.data.get(path)
+        if not isinstance(exact, t.Mapping):
+            exact = None  # A global option.
+        if found:
+            merged = {}
+            for _, _, value in sorted(found, key=lambda entry: entry[:2]):
+                merged.update(value)
+            if exact:
+                merged.update(exact)
+            fieldconf = MappingProxyType(merged)
+        elif exact:
+            fieldconf = MappingProxyType(exact)
+        else:
+            fieldconf = EMPTY
+        self.fieldconfs[path] = fieldconf
+        return fieldconf
@@ -1,23 +1,55 @@
-import abc
-from .meta import JSONField
-from typing import Dict
+from .meta import JSONField, split_type
+from typing import Dict, Mapping, Optional, Sequence, Tuple, Type, Union
+
+
+Key = Tuple[str, Optional[str], bool]
 
 
 class Converter:
+    """Field classes by schema type and format.
 
-    converter: Dict[str, JSONField]
+    Lookups go through a dispatch table keyed on (type, format, nullable),
+    filled on first lookup of each key. Formats without a registered
+    class fall back to the class of their type.
+    """
+
+    converters: Dict[Tuple[str, Optional[str]], Type[JSONField]]
+    table: Dict[Key, Type[JSONField]]
 
     def __init__(self):
         self.converters = {}
-
-    def register(self, type: str):
-        def type_registration(converter: JSONField):
-            self.converters[type] = converter
+        self.table = {}
+
+    def register(self, type: str, format: Optional[str] = None):
+        def type_registration(converter: Type[JSONField]):
+            self.converters[type, format] = converter
+            self.table = {
+                key: value for key, value in self.table.items()
+                if key[0] != type
+            }
             return converter
         return type_registration
 
-    def lookup(self, type: str, defs: dict = None):
-        return self.converters[type]
+    def lookup(self,
+               type: Union[str, Sequence[str]],
+               defs: dict = None,
+               *,
+               format: Optional[str] = None) -> Type[JSONField]:
+        name, nullable = split_type(type)
+        key = (name, format, nullable)
+        try:
+            return self.table[key]
+        except KeyError:
+            pass
+        converter = self.converters.get((name, format))
+        if converter is None:
+            converter = self.converters[name, None]
+        self.table[key] = converter
+        return converter
+
+    def dispatch(self, params: Mapping) -> Type[JSONField]:
+        """Returns the field class of a schema."""
+        return self.lookup(params['type'], format=params.get('format'))
 
 
 converter = Converter()
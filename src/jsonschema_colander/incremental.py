@@ -0,0 +1,169 @@
+import colander
+import typing as t
+from .cache import ordered
+from .converter import converter
+from .meta import JSONField
+from .refs import References
+from .types import Array, LazyFields, Object
+
+
+# Object keywords handled field by field: others changing recompile the
+# whole object.
+OBJECT_FIELDS = frozenset(('properties', 'required'))
+
+
+def without(params: t.Mapping, keys: t.Container[str]) -> t.Dict:
+    return {key: value for key, value in params.items() if key not in keys}
+
+
+def is_inline_object(params: t.Mapping) -> bool:
+    return params.get('type') == 'object' and '$ref' not in params
+
+
+def same(old: t.Any, new: t.Any) -> bool:
+    """Whether the schemas are equal, properties listed in the same
+    order: it is the order of the fields.
+    """
+    return old == new and ordered(old) == ordered(new)
+
+
+def has_ref(params: t.Any) -> bool:
+    """Whether the schema holds a `$ref`: its target may have changed
+    even if the schema did not.
+    """
+    if isinstance(params, dict):
+        return '$ref' in params or any(map(has_ref, params.values()))
+    if isinstance(params, list):
+        return any(map(has_ref, params))
+    return False
+
+
+def recompile(field: JSONField, old: t.Mapping, new: t.Mapping) -> JSONField:
+    """Returns the field compiled from the `new` schema, reusing the parts
+    of `field`, compiled from the `old` schema, that did not change.
+
+    Unchanged fields of `Object.fields` and `Array.subfield` are
+    relocated under the recompiled parent and the nodes of the memoized
+    node tree of `field` are shared: changed fields are compiled, changed
+    containers are rebuilt around them. Fields holding a `$ref` are
+    always recompiled. The schema is recompiled as a whole if its
+    definitions changed.
+    """
+    if same(old, new):
+        return field
+    if (recompiled := recompile_object(
+            field, old, new, field.parent, field.name, field.required,
+            field._node)) is not None:
+        return recompiled
+    return converter.dispatch(new).from_json(
+        new,
+        name=field.name,
+        required=field.required,
+        parent=field.parent,
+        config=field.config,
+    )
+
+
+def recompile_object(field: JSONField,
+                     old: t.Mapping,
+                     new: t.Mapping,
+                     parent: t.Optional[JSONField],
+                     name: str,
+                     required: bool,
+                     node: t.Optional[colander.SchemaNode]
+                     ) -> t.Optional[Object]:
+    """Recompiles an object field property by property. Returns None if
+    it cannot be: the object itself or its definitions changed.
+    """
+    if not isinstance(field, Object) or isinstance(field.fields, LazyFields):
+        return None
+    if not (is_inline_object(old) and is_inline_object(new)):
+        return None
+    if without(old, OBJECT_FIELDS) != without(new, OBJECT_FIELDS):
+        return None  # Definitions, title...
+
+    recompiled = JSONField.relocate(field, parent, name, required)
+    recompiled.references = References.of(parent, new)
+    old_properties = old.get('properties', {})
+    requirements = set(new.get('required', ()))
+    nodes = {} if node is None else {
+        child.name: child for child in node.children
+    }
+
+    fields = {}
+    children = []
+    for property_name, definition in recompiled.select(
+            new.get('properties', {})).items():
+        is_required = property_name in requirements
+        previous = field.fields.get(property_name)
+        subnode = nodes.get(property_name)
+        subfield = built = None
+        if previous is not None:
+            before = old_properties.get(property_name)
+            if same(before, definition) and not has_ref(definition):
+                subfield = previous.relocate(
+                    recompiled, property_name, is_required)
+                if subfield is not None and previous.required == is_required:
+                    built = subfield._node = subnode
+            elif isinstance(before, t.Mapping):
+                subfield, built = recompile_subfield(
+                    previous, before, definition,
+                    recompiled, property_name, is_required, subnode
+                )
+        if subfield is None:
+            subfield = recompiled.compile_field(
+                property_name, definition, is_required)
+        fields[property_name] = subfield
+        children.append(built)
+
+    recompiled.fields = fields
+    if node is not None:
+        recompiled._node = recompiled.build([
+            subfield() if built is None else built
+            for subfield, built in zip(fields.values(), children)
+        ])
+    return recompiled
+
+
+def recompile_subfield(previous: JSONField,
+                       old: t.Mapping,
+                       new: t.Mapping,
+                       parent: Object,
+                       name: str,
+                       required: bool,
+                       node: t.Optional[colander.SchemaNode]
+                       ) -> t.Tuple[t.Optional[JSONField],
+                                    t.Optional[colander.SchemaNode]]:
+    """Recompiles a changed object, or the items of a changed array.
+    Returns the field and its node, if it could be rebuilt.
+    """
+    if isinstance(previous, Object):
+        field = recompile_object(
+            previous, old, new, parent, name, required, node)
+        if field is None:
+            return None, None
+        return field, field._node
+
+    if not (isinstance(previous, Array) and previous.subfield is not None):
+        return None, None
+    if old.get('type') != 'array' or '$ref' in old or '$ref' in new:
+        return None, None
+    if without(old, {'items'}) != without(new, {'items'}):
+        return None, None
+    old_items, new_items = old.get('items'), new.get('items')
+    if not (isinstance(old_items, t.Mapping)
+            and isinstance(new_items, t.Mapping)):
+        return None, None
+
+    items = previous.subfield
+    subfield = recompile_object(
+        items, old_items, new_items, parent, items.name, items.required,
+        None if node is None else node.children[0]
+    )
+    if subfield is None:
+        return None, None
+    field = JSONField.relocate(previous, parent, name, required)
+    field.subfield = subfield
+    if subfield._node is None:
+        return field, None
+    return field, field.build(subfield._node)
@@ -1,34 +1,65 @@
 import abc
+import copy
 import colander
-from functools import cached_property
+import operator
+import threading
+from functools import lru_cache
 from types import MappingProxyType
 import typing as t
+from .compiler import compile_deserializer
+from .config import EMPTY, Configuration
+from .profiling import instrument
+from .widgets import default_widget_makers, available
 
-try:
-    from deform.schema import default_widget_makers
-    READONLY_WIDGET = True
-except ImportError:
-    default_widget_makers = {}
-    READONLY_WIDGET = False
 
+def __getattr__(name: str):
+    if name == 'READONLY_WIDGET':
+        # Checking it imports deform.
+        return available()
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
 
-class Path(str):
 
-    fragments: t.Sequence[str]
+def readonly(mapping: t.Mapping) -> MappingProxyType:
+    return MappingProxyType(mapping) if mapping else EMPTY
+
+
+@lru_cache(maxsize=4096)
+def compile_resolver(path: str) -> t.Callable[[t.Mapping], t.Any]:
+    """Compiles the lookup of a dotted path in nested mappings.
+    """
+    getters = tuple(operator.itemgetter(stub) for stub in path.split('.'))
+    if len(getters) == 1:
+        return getters[0]
+
+    def resolve(node):
+        for getter in getters:
+            node = getter(node)
+        return node
+    return resolve
+
+
+class Path(str):
+    __slots__ = ()
 
     def __new__(cls, value: t.Union[str, 'Path']):
         if isinstance(value, Path):
             return value  # idempotency
-        string = super().__new__(cls, value)
-        string.fragments = string.split('.')
-        return string
+        return super().__new__(cls, value)
+
+    @property
+    def fragments(self) -> t.Sequence[str]:
+        return self.split('.')
+
+    @property
+    def resolver(self) -> t.Callable[[t.Mapping], t.Any]:
+        return compile_resolver(self)
 
     def resolve(self, node: t.Mapping[str, t.Any]) -> t.Any:
-        for stub in self.fragments:
-           node = node[stub]
-        return node
+        return compile_resolver(self)(node)
 
     def missing(self):
+        resolve = self.resolver
+
         @colander.deferred
         def deferred_missing(node, kw):
             """in order to work, you need to bind the schema with 'data'.
@@ -36,7 +67,7 @@ class Path(str):
             """
             if data := kw.get('data'):
                 try:
-                    return self.resolve(data)
+                    return resolve(data)
                 except KeyError:
                     return None
         return deferred_missing
@@ -54,29 +85,200 @@ class Path(str):
         raise NameError('Unnamed field with no parent.')
 
 
+class Paths(dict):
+    """Interned paths of a schema: equal paths are the same object.
+    """
+
+    def create(self, parent, name: str) -> Path:
+        path = Path.create(parent, name)
+        return self.setdefault(path, path)
+
+
+def split_type(type: t.Union[str, t.Sequence[str]]) -> t.Tuple[str, bool]:
+    """Splits a schema `type`, possibly a union with "null", into the
+    type and whether null values are allowed.
+    """
+    if isinstance(type, str):
+        return type, False
+    types = [name for name in type if name != 'null']
+    if len(types) != 1:
+        raise NotImplementedError(f'Unsupported type union: {type}.')
+    return types[0], len(types) < len(type)
+
+
+class NullableType:
+    """Wraps the type of a node accepting null (`None`) values."""
+
+    def __init__(self, typ):
+        self.typ = typ
+
+    @classmethod
+    def of(cls, typ) -> 'NullableType':
+        if isinstance(typ, colander.Positional):
+            return NullableSequence(typ)
+        return cls(typ)
+
+    def __getattr__(self, name: str):
+        if name == 'typ':
+            raise AttributeError(name)
+        return getattr(self.typ, name)
+
+    def serialize(self, node, appstruct):
+        if appstruct is None:
+            return None
+        return self.typ.serialize(node, appstruct)
+
+    def deserialize(self, node, cstruct):
+        if cstruct is None:
+            return None
+        return self.typ.deserialize(node, cstruct)
+
+
+class NullableSequence(NullableType, colander.Positional):
+    """Nullable positional type: errors of the items are keyed on their
+    position.
+    """
+
+
+class SkipNone:
+    """Node validator ignoring null (`None`) values."""
+
+    def __init__(self, validator: t.Callable):
+        self.validator = validator
+
+    def __call__(self, node, value):
+        if value is not None:
+            self.validator(node, value)
+
+
+def combine(validators: t.Sequence[t.Callable]) -> t.Optional[t.Callable]:
+    """Returns a single node validator checking all the validators."""
+    if len(validators) > 1:
+        return colander.All(*validators)
+    if validators:
+        return validators[0]
+    return None
+
+
+@lru_cache(maxsize=None)
+def slotnames(cls: type) -> t.Tuple[str, ...]:
+    names = []
+    for klass in reversed(cls.__mro__):
+        slots = klass.__dict__.get('__slots__', ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        names.extend(
+            name for name in slots if name not in ('__dict__', '__weakref__')
+        )
+    return tuple(names)
+
+
+@lru_cache(maxsize=None)
+def deferred_names(cls: type) -> t.Tuple[str, ...]:
+    """Names of the deferred class attributes of a node class."""
+    return tuple(
+        name for name in dir(cls)
+        if isinstance(getattr(cls, name, None), colander.deferred)
+    )
+
+
+def add_deferred_child(node: colander.SchemaNode, name: str,
+                       child: colander.SchemaNode):
+    """Adds a node resolved from a deferred, like `SchemaNode.bind`."""
+    if not child.name:
+        child.name = name
+    if child.raw_title is colander.SchemaNode.raw_title:
+        child.title = name.replace('_', ' ').title()
+    exists = child.name in node
+    if (before := getattr(child, 'insert_before', None)) is None:
+        if exists:
+            node[child.name] = child
+        else:
+            node.add(child)
+    else:
+        if exists:
+            del node[child.name]
+        node.add_before(before, child)
+
+
+def copy_field(field: 'JSONField', cls: t.Type['JSONField']) -> 'JSONField':
+    """Shallow copy of the slots of the field, as an instance of `cls`."""
+    copied = object.__new__(cls)
+    for name in slotnames(cls):
+        try:
+            object.__setattr__(copied, name, getattr(field, name))
+        except AttributeError:
+            pass  # Unset slot.
+    return copied
+
+
 class DefinitionsHolder:
+    __slots__ = ()
+
     definitions: t.Optional[t.Mapping]
 
 
 class JSONField(abc.ABC):
-    supported: t.ClassVar[set]
-    ignore: t.ClassVar[set] = {
+    __slots__ = (
+        'type',
+        'name',
+        'title',
+        'label',
+        'description',
+        'schema_validators',
+        'validators',
+        'attributes',
+        'required',
+        'nullable',
+        'readonly',
+        '__path__',
+        'paths',
+        'fieldconf',
+        'parent',
+        'config',
+        '_factory',
+        '_node',
+        '_deserializer',
+        '_widget',
+    )
+
+    supported: t.ClassVar[frozenset]
+    ignore: t.ClassVar[frozenset] = frozenset({
         'name', 'type', 'title', 'description', 'anyOf', 'if', 'then'
-    }
-    allowed: t.ClassVar[set] = {'default'}
+    })
+    allowed: t.ClassVar[frozenset] = frozenset({'default'})
+    accepted: t.ClassVar[frozenset] = ignore | allowed
 
     type: str
     name: str
+    title: t.Optional[str]
     label: str
     description: str
+    schema_validators: t.List
     validators: t.List
     attributes: t.Dict
     required: bool
+    nullable: bool
     readonly: bool
-    __path__: str
-    parent: t.Optional['JSONField'] = None
-    factory: t.Optional[t.Callable] = None
-    config: t.Optional[t.Mapping] = None
+    __path__: Path
+    paths: Paths
+    fieldconf: t.Mapping
+    parent: t.Optional['JSONField']
+    config: Configuration
+    _factory: t.Optional[t.Callable]
+    _node: t.Optional[colander.SchemaNode]
+    _deserializer: t.Optional[t.Callable]
+    _widget: t.Optional[t.Tuple[t.Tuple, t.Any]]
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Frozen once, checked for every compiled field.
+        if hasattr(cls, 'supported'):
+            cls.supported = frozenset(cls.supported)
+        cls.ignore = frozenset(cls.ignore)
+        cls.allowed = frozenset(cls.allowed)
+        cls.accepted = cls.ignore | cls.allowed
+        instrument(cls)
 
     def __init__(self,
                  type: str,
@@ -88,40 +290,106 @@ class JSONField(abc.ABC):
                  label: str = '',
                  description: str = '',
                  config: t.Optional[t.Mapping] = None,
-                 parent: t.Optional['JSONField'] = None
+                 parent: t.Optional['JSONField'] = None,
+                 nullable: bool = False
                  ):
         if type not in self.supported:
             raise TypeError(
                 f'{self.__class__} does not support the {type} type.')
 
-        self.__path__ = Path.create(parent, name)
-
-        if config is None:
-            config = MappingProxyType({})
-        elif not isinstance(config, MappingProxyType):
-            config = MappingProxyType(config)
-
-        self.config = config
-        self.fieldconf = MappingProxyType(self.config.get(self.__path__, {}))
-
+        self.config = Configuration.of(config)
         self.type = type
         self.name = name
-        self.label = label or name
+        self.title = label
         self.description = description
         self.required = required
+        self.nullable = nullable
+        self.schema_validators = validators
+        self.attributes = attributes
+        self.parent = parent
+        self._factory = None
+        self._node = None
+        self._deserializer = None
+        self._widget = None
+        self.locate()
+
+    @property
+    def factory(self) -> t.Optional[t.Callable]:
+        """Colander type overriding the default one, if set."""
+        return self._factory
+
+    @factory.setter
+    def factory(self, factory: t.Optional[t.Callable]):
+        self._factory = factory
+
+    def locate(self):
+        """Computes the state that depends on the position of the field:
+        its path and the configuration it matches.
+        """
+        if self.parent is not None:
+            self.paths = self.parent.paths
+        else:
+            self.paths = Paths()
+        self.__path__ = self.paths.create(self.parent, self.name)
+        self.fieldconf = self.config.fieldconf(self.__path__)
+        self.label = self.title or self.name
         self.readonly = self.fieldconf.get(
             'readonly', self.config.get('readonly', False)
         )
-        self.validators = validators
         if validators := self.fieldconf.get('validators'):
-            self.validators.extend(validators)
-        self.attributes = attributes
-        self.parent = parent
+            self.validators = [*self.schema_validators, *validators]
+        else:
+            self.validators = self.schema_validators
+
+    def relocate(self,
+                 parent: t.Optional['JSONField'],
+                 name: str,
+                 required: bool) -> t.Optional['JSONField']:
+        """Returns a copy of the field, positioned as if it was compiled
+        with the given parent and name. Returns None if the field cannot
+        be reused at that position.
+        """
+        field = copy.copy(self)
+        field.parent = parent
+        field.name = name
+        field.required = required
+        field._node = None
+        field._deserializer = None
+        field.locate()
+        return field
+
+    def __copy__(self):
+        return copy_field(self, type(self))
+
+    def __getstate__(self):
+        state = {
+            name: getattr(self, name)
+            for name in slotnames(type(self))
+            if hasattr(self, name)
+        }
+        state['_node'] = state['_deserializer'] = state['_widget'] = None
+        # Read-only views (field configurations, frozen containers)
+        # cannot be pickled: their content is.
+        views = tuple(
+            name for name, value in state.items()
+            if isinstance(value, MappingProxyType)
+        )
+        for name in views:
+            state[name] = dict(state[name])
+        return views, state
+
+    def __setstate__(self, state):
+        views, state = state
+        for name, value in state.items():
+            if name in views:
+                value = readonly(value)
+            object.__setattr__(self, name, value)
 
     def get_definitions(self, node):
         while node is not None:
             if isinstance(node, DefinitionsHolder):
                 return node.definitions
+            node = node.parent
         return {}
 
     def get_options(self):
@@ -140,10 +408,8 @@ class JSONField(abc.ABC):
             'description': self.description,
             'missing': missing
         }
-        if len(self.validators) > 1:
-            options['validator'] = colander.All(*self.validators)
-        elif len(self.validators) == 1:
-            options['validator'] = self.validators[0]
+        if (validator := combine(self.validators)) is not None:
+            options['validator'] = validator
         return options
 
     @abc.abstractmethod
@@ -156,16 +422,163 @@ class JSONField(abc.ABC):
         if widget := default_widget_makers.get(factory):
             if isinstance(widget, colander.deferred):
                 return widget
-            if READONLY_WIDGET:
+            if available():
                 return widget(readonly=self.readonly)
             return widget()
         return None
 
+    @property
+    def with_widgets(self) -> bool:
+        """False in validation-only mode: nodes are built without widgets.
+        """
+        return self.fieldconf.get('widgets', self.config.get('widgets', True))
+
+    def lookup_widget(self, factory, options):
+        """Returns the widget of `get_widget`, built once per factory and
+        readonly state, or None in validation-only mode.
+        """
+        if not self.with_widgets:
+            return None
+        key = (factory, self.readonly)
+        if self._widget is None or self._widget[0] != key:
+            self._widget = (key, self.get_widget(factory, options))
+        return self._widget[1]
+
+    def finalize(self, node: colander.SchemaNode) -> colander.SchemaNode:
+        """Adapts the node built by `__call__` to the field: nullable
+        fields accept `None`, which is not validated.
+        """
+        if self.nullable:
+            if getattr(node, 'widget', None) is None:
+                # deform looks the default widgets up by type: not the
+                # wrapping one.
+                if (widget := self.lookup_widget(type(node.typ), {})) \
+                   is not None:
+                    node.widget = widget
+            node.typ = NullableType.of(node.typ)
+            if node.validator is not None:
+                node.validator = SkipNone(node.validator)
+        return node
+
     def __call__(self):
         factory = self.get_factory()
         options = self.get_options()
-        widget = self.get_widget(factory, options)
-        return colander.SchemaNode(factory(), widget=widget, **options)
+        widget = self.lookup_widget(factory, options)
+        return self.finalize(
+            colander.SchemaNode(factory(), widget=widget, **options))
+
+    def get_node(self, shared: bool = False) -> colander.SchemaNode:
+        """Returns the node tree built by `__call__`, memoized on the field.
+        By default, a clone is returned: it can be bound or altered freely.
+        A `shared` node is the memoized instance itself and must be treated
+        as read-only.
+        """
+        if self._node is None:
+            self._node = self()
+        if shared:
+            return self._node
+        return self._node.clone()
+
+    def reset_node(self):
+        """Drops the memoized node tree and widget, to be rebuilt on next
+        access.
+        """
+        self._node = None
+        self._deserializer = None
+        self._widget = None
+
+    def bind(self, **kw) -> colander.SchemaNode:
+        """Returns a bound clone of the memoized node tree, like
+        `colander.SchemaNode.bind`. The readonly `missing` values are
+        looked up while walking `data` once, along the fields.
+        """
+        node = self.get_node()
+        container = None
+        if data := kw.get('data'):
+            container = data
+            if self.parent is not None and self.parent.__path__:
+                try:
+                    container = self.parent.__path__.resolve(data)
+                except KeyError:
+                    container = None
+        self.bind_node(node, container, kw)
+        return node
+
+    def bind_node(self, node: colander.SchemaNode,
+                  container: t.Optional[t.Mapping], kw: t.Mapping):
+        """Binds the node built by the field, as `SchemaNode.bind` does:
+        deferred attributes are resolved, then `after_bind` is called.
+        `container` is the data holding the value of the field, if any.
+        """
+        node.bindings = kw
+        if self.readonly and not self.required:
+            if isinstance(container, t.Mapping):
+                node.missing = container.get(self.name)
+            else:
+                node.missing = None
+        names = [*node.__dict__, *(
+            name for name in deferred_names(type(node))
+            if name not in node.__dict__
+        )]
+        for name in names:
+            if isinstance(value := getattr(node, name), colander.deferred):
+                value = value(node, kw)
+                if isinstance(value, colander.SchemaNode):
+                    add_deferred_child(node, name, value)
+                else:
+                    setattr(node, name, value)
+        if getattr(node, 'after_bind', None):
+            node.after_bind(node, kw)
+
+    def get_deserializer(self) -> t.Callable[[t.Any], t.Any]:
+        """Returns the deserializer compiled from the memoized node tree.
+        See `compiler.compile_deserializer`.
+        """
+        if self._deserializer is None:
+            self._deserializer = compile_deserializer(
+                self.get_node(shared=True))
+        return self._deserializer
+
+    def subfields(self) -> t.Iterable['JSONField']:
+        """Returns the direct subfields of the field."""
+        return ()
+
+    def materialize(self):
+        """Compiles what is otherwise compiled on demand and replaces the
+        containers of the field by immutable ones. See `freeze`.
+        """
+        self.schema_validators = tuple(self.schema_validators)
+        self.validators = tuple(self.validators)
+        attributes = dict(self.attributes)
+        if isinstance(choices := attributes.get('choices'), list):
+            attributes['choices'] = tuple(choices)
+        self.attributes = readonly(attributes)
+
+    def freeze(self) -> 'JSONField':
+        """Makes the field and its subfields immutable, to share them
+        between threads. Lazy fields and recursive references are compiled,
+        the node tree and deserializer are built: building, binding and
+        deserializing no longer alter the fields.
+
+        Fields are frozen in place: setting their attributes raises a
+        `FrozenError`. Copies (`copy.copy`, `relocate`) are not frozen.
+        """
+        fields = []
+        stack = [self]
+        seen = set()
+        while stack:
+            field = stack.pop()
+            if id(field) in seen or isinstance(field, Frozen):
+                continue
+            seen.add(id(field))
+            field.materialize()
+            fields.append(field)
+            stack.extend(field.subfields())
+        if not isinstance(self, Frozen):
+            self.get_deserializer()
+        for field in fields:
+            field.__class__ = frozen_class(type(field))
+        return self
 
     @classmethod
     def extract(cls, params: dict, available: set) -> t.Tuple[t.List, t.Dict]:
@@ -182,12 +595,13 @@ class JSONField(abc.ABC):
             required: bool = False
     ):
         available = set(params.keys())
-        if illegal := ((available - cls.ignore) - cls.allowed):
+        if illegal := (available - cls.accepted):
             raise NotImplementedError(
                 f'Unsupported attributes: {illegal} for {cls}.')
         validators, attributes = cls.extract(params, available)
+        type, nullable = split_type(params['type'])
         return cls(
-            params['type'],
+            type,
             name,
             required,
             validators,
@@ -195,5 +609,80 @@ class JSONField(abc.ABC):
             parent=parent,
             config=config,
             label=params.get('title'),
-            description=params.get('description')
+            description=params.get('description'),
+            nullable=nullable
         )
+
+
+instrument(JSONField)
+
+
+class FrozenError(AttributeError):
+    """Raised when setting an attribute of a frozen field."""
+
+
+class Frozen:
+    """Mixin of the frozen field classes, see `JSONField.freeze`.
+
+    The memoized node tree and deserializer of a frozen field, if missing
+    (e.g. after unpickling), are built once, under a lock.
+    """
+    __slots__ = ()
+
+    thawed: t.ClassVar[t.Type[JSONField]]
+    lock: t.ClassVar[threading.RLock] = threading.RLock()
+
+    def __setattr__(self, name: str, value: t.Any):
+        raise FrozenError(f'Cannot set {name!r} on a frozen field.')
+
+    def __delattr__(self, name: str):
+        raise FrozenError(f'Cannot delete {name!r} on a frozen field.')
+
+    def __copy__(self) -> JSONField:
+        return copy_field(self, self.thawed)
+
+    def __reduce_ex__(self, protocol):
+        return (frozen_instance, (self.thawed,), self.__getstate__())
+
+    def memoize(self, name: str, factory: t.Callable[[], t.Any]) -> t.Any:
+        if (value := getattr(self, name)) is None:
+            with self.lock:
+                if (value := getattr(self, name)) is None:
+                    value = factory()
+                    object.__setattr__(self, name, value)
+        return value
+
+    def get_node(self, shared: bool = False) -> colander.SchemaNode:
+        node = self.memoize('_node', self)
+        if shared:
+            return node
+        return node.clone()
+
+    def get_deserializer(self) -> t.Callable[[t.Any], t.Any]:
+        return self.memoize('_deserializer', lambda: compile_deserializer(
+            self.get_node(shared=True)))
+
+    def reset_node(self):
+        raise FrozenError('Cannot reset the node of a frozen field.')
+
+    def lookup_widget(self, factory, options):
+        if not self.with_widgets:
+            return None
+        if self._widget is not None and \
+           self._widget[0] == (factory, self.readonly):
+            return self._widget[1]
+        return self.get_widget(factory, options)
+
+
+@lru_cache(maxsize=None)
+def frozen_class(cls: t.Type[JSONField]) -> t.Type[JSONField]:
+    """Returns the frozen version of a field class."""
+    return type(cls)(f'Frozen{cls.__name__}', (Frozen, cls), {
+        '__slots__': (),
+        '__module__': cls.__module__,
+        'thawed': cls,
+    })
+
+
+def frozen_instance(cls: t.Type[JSONField]) -> JSONField:
+    return object.__new__(frozen_class(cls))
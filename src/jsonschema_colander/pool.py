@@ -0,0 +1,68 @@
+import threading
+import typing as t
+from collections import OrderedDict, namedtuple
+
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+
+def typed(value: t.Any) -> t.Tuple[type, t.Any]:
+    # 1, 1.0 and True are equal but render differently in error messages.
+    if isinstance(value, tuple):
+        return tuple, tuple(map(typed, value))  # Enums.
+    return type(value), value
+
+
+class ValidatorPool:
+    """Bounded LRU pool of validator instances, keyed on their class and
+    parameters. Fields declaring the same constraints share the same
+    validator: pooled validators must not be altered.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, factory: t.Callable, *args, **kwargs):
+        """Returns the pooled `factory(*args, **kwargs)`, creating it
+        if needed. Unhashable parameters are not pooled.
+        """
+        key = (
+            factory,
+            tuple(map(typed, args)),
+            frozenset((name, *typed(value)) for name, value in kwargs.items())
+        )
+        try:
+            hash(key)
+        except TypeError:
+            with self._lock:
+                self.misses += 1
+            return factory(*args, **kwargs)
+
+        with self._lock:
+            if (validator := self._entries.get(key)) is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return validator
+            self.misses += 1
+            validator = self._entries[key] = factory(*args, **kwargs)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+            return validator
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def cache_info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self))
+
+
+validator_pool = ValidatorPool()
@@ -0,0 +1,143 @@
+import contextlib
+import contextvars
+import functools
+import threading
+import time
+import typing as t
+from collections import defaultdict
+
+
+Observer = t.Callable[[str, str, float], None]
+
+# Instrumented methods and the phase they are reported as.
+PHASES = {
+    'from_json': 'from_json',
+    'extract': 'extract',
+    'set_fields': 'set_fields',
+    'set_items': 'set_items',
+    'get_factory': 'get_factory',
+    'get_widget': 'get_widget',
+    '__call__': 'node',
+}
+
+_observer: contextvars.ContextVar[t.Optional[Observer]] = \
+    contextvars.ContextVar('jsonschema_colander.observer', default=None)
+
+# Innermost timed call: ((phase, path), parent frame).
+_frame: contextvars.ContextVar[t.Optional[t.Tuple]] = \
+    contextvars.ContextVar('jsonschema_colander.frame', default=None)
+
+
+# Count of the active `observe` blocks, in any context.
+_active = 0
+_lock = threading.Lock()
+
+
+def instrument(cls: type):
+    """Wraps the phase methods defined by the class, once. Unless a
+    block is observed, the wrappers call the method right away.
+    """
+    for name in PHASES:
+        attribute = cls.__dict__.get(name)
+        if attribute is None:
+            continue
+        phase = PHASES[name]
+        if isinstance(attribute, classmethod):
+            if not hasattr(attribute.__func__, '__timed__'):
+                setattr(cls, name, classmethod(timed(phase, attribute.__func__)))
+        elif not hasattr(attribute, '__timed__'):
+            setattr(cls, name, timed(phase, attribute))
+
+
+@contextlib.contextmanager
+def observe(observer: Observer):
+    """Reports the phases run in the block to `observer`, as
+    `observer(phase, path, seconds)` calls. Times are inclusive: the
+    phases of a container include the ones of its fields.
+
+    Only the calls made in the context of the block are reported.
+    Outside of any block, the phase methods only check a module flag.
+    """
+    global _active
+    token = _observer.set(observer)
+    with _lock:
+        _active += 1
+    try:
+        yield observer
+    finally:
+        with _lock:
+            _active -= 1
+        _observer.reset(token)
+
+
+def locate(owner, phase: str, kwargs: t.Mapping) -> str:
+    if not isinstance(owner, type):
+        return getattr(owner, '__path__', None) or ''
+    if phase == 'from_json':
+        name = kwargs.get('name') or ''
+        if (parent := kwargs.get('parent')) is None:
+            return name
+        if base := parent.__path__:
+            return f'{base}.{name}' if name else base
+        return name
+    # Other class methods run within `from_json`.
+    if (frame := _frame.get()) is not None:
+        return frame[0][1]
+    return ''
+
+
+def timed(phase: str, method: t.Callable) -> t.Callable:
+    """Wraps a method to report its calls to the observer of the
+    current context, if any.
+    """
+    @functools.wraps(method)
+    def timed_method(owner, *args, **kwargs):
+        if not _active or (observer := _observer.get()) is None:
+            return method(owner, *args, **kwargs)
+        key = (phase, locate(owner, phase, kwargs))
+        frame = _frame.get()
+        if frame is not None and frame[0] == key:
+            # Overridden method calling `super()`: timed once.
+            return method(owner, *args, **kwargs)
+        token = _frame.set((key, frame))
+        start = time.perf_counter()
+        try:
+            return method(owner, *args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            _frame.reset(token)
+            observer(phase, key[1], elapsed)
+
+    timed_method.__timed__ = phase
+    return timed_method
+
+
+class Timings:
+    """Observer aggregating the calls and time per phase and path."""
+
+    def __init__(self):
+        self.entries = defaultdict(lambda: [0, 0.0])
+
+    def __call__(self, phase: str, path: str, seconds: float):
+        entry = self.entries[phase, path]
+        entry[0] += 1
+        entry[1] += seconds
+
+    def by_phase(self) -> t.Dict[str, float]:
+        totals = defaultdict(float)
+        for (phase, _), (_, seconds) in self.entries.items():
+            totals[phase] += seconds
+        return dict(totals)
+
+    def slowest(self, phase: str, count: int = 10
+                ) -> t.List[t.Tuple[str, int, float]]:
+        """Returns the `(path, calls, seconds)` of the slowest paths."""
+        return sorted(
+            (
+                (path, calls, seconds)
+                for (name, path), (calls, seconds) in self.entries.items()
+                if name == phase
+            ),
+            key=lambda entry: entry[2],
+            reverse=True
+        )[:count]
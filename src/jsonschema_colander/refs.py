@@ -0,0 +1,320 @@
+import colander
+import threading
+import typing as t
+from urllib.parse import unquote
+from .converter import converter
+from .meta import JSONField, split_type
+
+
+MAX_DEPTH = 8
+MAX_EXPANSIONS = 1000
+
+
+def split_pointer(ref: str) -> t.Tuple[str, ...]:
+    """Splits a local reference (`#/definitions/A~1B`) into its
+    unescaped JSON Pointer tokens (`('definitions', 'A/B')`).
+    """
+    if not ref.startswith('#'):
+        raise NotImplementedError(f'Unsupported remote reference: {ref}.')
+    pointer = unquote(ref[1:])
+    if not pointer:
+        return ()
+    if not pointer.startswith('/'):
+        raise NotImplementedError(f'Unsupported anchor reference: {ref}.')
+    return tuple(
+        token.replace('~1', '/').replace('~0', '~')
+        for token in pointer[1:].split('/')
+    )
+
+
+class References:
+    """Index of the `$ref` targets of a root schema.
+
+    Targets are resolved once, as JSON Pointers against the root
+    document, and compiled once: further references to the same
+    target reuse the compiled field, relocated at their position.
+
+    A reference to a target that is being compiled is a cycle: it
+    compiles to a `Recursive` placeholder, expanded on demand.
+    """
+
+    root: t.Mapping
+    targets: t.Dict[str, t.Mapping]
+    compiled: t.Dict[int, t.Tuple[t.Mapping, JSONField]]
+    compiling: t.Dict[int, t.Mapping]
+    fanouts: t.Dict[str, int]
+    level: int
+
+    def __init__(self, root: t.Mapping):
+        self.root = root
+        self.targets = {}
+        self.compiled = {}
+        self.compiling = {}
+        self.fanouts = {}
+        self.level = 0
+        self.lock = threading.RLock()
+        self.index(root)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.lock = threading.RLock()
+        # Targets are keyed on their identity, which pickling changes.
+        self.compiled = {
+            id(target): (target, field)
+            for target, field in self.compiled.values()
+        }
+        self.compiling = {
+            id(target): target for target in self.compiling.values()
+        }
+
+    @classmethod
+    def of(cls, parent: t.Optional[JSONField], params: t.Mapping):
+        """Returns the index of the parent field or a new one, if the
+        params are a root schema.
+        """
+        if (references := getattr(parent, 'references', None)) is not None:
+            return references
+        return cls(params)
+
+    def index(self, node: t.Any):
+        if isinstance(node, dict):
+            ref = node.get('$ref')
+            if isinstance(ref, str) and ref not in self.targets:
+                try:
+                    self.targets[ref] = self.lookup(ref)
+                except (LookupError, ValueError, NotImplementedError):
+                    pass  # might be a legacy, scoped, definition name.
+            for value in node.values():
+                self.index(value)
+        elif isinstance(node, list):
+            for value in node:
+                self.index(value)
+
+    def lookup(self, ref: str) -> t.Mapping:
+        node = self.root
+        for token in split_pointer(ref):
+            if isinstance(node, list):
+                node = node[int(token)]
+            else:
+                node = node[token]
+        return node
+
+    def resolve(self, ref: str,
+                definitions: t.Optional[t.Mapping] = None) -> t.Mapping:
+        if (target := self.targets.get(ref)) is not None:
+            return target
+        try:
+            target = self.targets[ref] = self.lookup(ref)
+        except (LookupError, ValueError):
+            # Definitions in scope, looked up by name.
+            if definitions and (name := ref.split('/')[-1]) in definitions:
+                return definitions[name]
+            raise NotImplementedError(f'Missing definition for {ref}.')
+        return target
+
+    def compile(self, ref: str, *,
+                name: str,
+                required: bool,
+                parent: t.Optional[JSONField],
+                config: t.Optional[t.Mapping] = None,
+                definitions: t.Optional[t.Mapping] = None) -> JSONField:
+        target = self.resolve(ref, definitions)
+        if not target.get('type'):
+            raise NotImplementedError(
+                f'Undefined type for property {name}')
+
+        key = id(target)
+        if key in self.compiling:
+            return Recursive(
+                self, ref, target, self.level, name, required,
+                parent=parent,
+                config=config,
+                definitions=definitions,
+            )
+
+        # Expansions of recursive references never share their fields:
+        # they are compiled one level deeper each time.
+        if not self.level and (compiled := self.compiled.get(key)) \
+           and compiled[0] is target:
+            field = compiled[1].relocate(parent, name, required)
+            if field is not None:
+                return field
+
+        self.compiling[key] = target
+        try:
+            field = converter.dispatch(target).from_json(
+                target,
+                name=name,
+                required=required,
+                parent=parent,
+                config=config,
+            )
+        finally:
+            self.compiling.pop(key, None)
+        if not self.level:
+            self.compiled.setdefault(key, (target, field))
+        return field
+
+
+class DepthExceeded(colander.SchemaType):
+    """Type of the nodes standing past the maximal depth of a recursive
+    reference: any value is invalid.
+    """
+
+    def __init__(self, depth: int):
+        self.depth = depth
+
+    def serialize(self, node, appstruct):
+        return colander.null
+
+    def deserialize(self, node, cstruct):
+        if cstruct is colander.null:
+            return colander.null
+        raise colander.Invalid(node, colander._(
+            'Maximum depth of ${depth} exceeded',
+            mapping={'depth': self.depth}
+        ))
+
+
+def count_recursive(field: JSONField) -> int:
+    """Counts the recursive references of a field, not expanded."""
+    count = 0
+    stack = [field]
+    while stack:
+        field = stack.pop()
+        if isinstance(field, Recursive):
+            count += 1
+        else:
+            stack.extend(field.subfields())
+    return count
+
+
+class Recursive(JSONField):
+    """Placeholder for a recursive reference.
+
+    The referenced target is compiled when the node is built, one level
+    deeper than the placeholder, until the `max_depth` configuration
+    (defaults to `MAX_DEPTH`) is reached.
+
+    Expansion is eager: a target holding `n` recursive references
+    expands into `n ** depth` copies at each depth. The depth is lowered
+    for such targets, so that the expansions of a placeholder stay
+    within the `max_expansions` configuration (defaults to
+    `MAX_EXPANSIONS`).
+    """
+    __slots__ = (
+        'references', 'ref', 'target', 'depth', 'definitions', 'field'
+    )
+
+    supported = {'object', 'array', 'string', 'integer', 'number', 'boolean'}
+
+    references: References
+    ref: str
+    target: t.Mapping
+    depth: int
+    definitions: t.Optional[t.Mapping]
+    field: t.Optional[JSONField]
+
+    def __init__(self,
+                 references: References,
+                 ref: str,
+                 target: t.Mapping,
+                 depth: int,
+                 name: str,
+                 required: bool,
+                 *,
+                 definitions: t.Optional[t.Mapping] = None,
+                 **kwargs):
+        self.references = references
+        self.ref = ref
+        self.target = target
+        self.depth = depth
+        self.definitions = definitions
+        self.field = None
+        type, nullable = split_type(target['type'])
+        super().__init__(
+            type, name, required, [], {},
+            label=target.get('title'),
+            description=target.get('description'),
+            nullable=nullable,
+            **kwargs
+        )
+
+    @property
+    def max_depth(self) -> int:
+        return self.config.get('max_depth', MAX_DEPTH)
+
+    @property
+    def max_expansions(self) -> int:
+        return self.config.get('max_expansions', MAX_EXPANSIONS)
+
+    @property
+    def depth_limit(self) -> int:
+        """`max_depth`, lowered to the depth at which the expansions of
+        the placeholder would exceed `max_expansions`.
+        """
+        fanout = self.references.fanouts.get(self.ref, 0)
+        if fanout < 2:
+            return self.max_depth
+        depth = expansions = width = 1
+        while depth < self.max_depth:
+            width *= fanout
+            expansions += width
+            if expansions > self.max_expansions:
+                break
+            depth += 1
+        return depth
+
+    def relocate(self, parent, name, required):
+        field = super().relocate(parent, name, required)
+        field.field = None
+        return field
+
+    def expand(self) -> t.Optional[JSONField]:
+        """Returns the compiled target, or None if the maximal depth
+        is reached.
+        """
+        if self.field is None and self.depth < self.depth_limit:
+            references = self.references
+            with references.lock:
+                level, references.level = references.level, self.depth + 1
+                try:
+                    self.field = references.compile(
+                        self.ref,
+                        name=self.name,
+                        required=self.required,
+                        parent=self.parent,
+                        config=self.config,
+                        definitions=self.definitions,
+                    )
+                finally:
+                    references.level = level
+                references.fanouts.setdefault(
+                    self.ref, count_recursive(self.field))
+        return self.field
+
+    def subfields(self):
+        if (field := self.expand()) is not None:
+            return (field,)
+        return ()
+
+    def get_factory(self):
+        if (field := self.expand()) is not None:
+            return field.get_factory()
+        return DepthExceeded
+
+    def bind_node(self, node, container, kw):
+        if (field := self.expand()) is not None:
+            return field.bind_node(node, container, kw)
+        return super().bind_node(node, container, kw)
+
+    def __call__(self):
+        if (field := self.expand()) is not None:
+            return field()
+        return colander.SchemaNode(
+            DepthExceeded(self.depth_limit), **self.get_options())
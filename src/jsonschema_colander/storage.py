@@ -0,0 +1,37 @@
+import array
+import typing as t
+from .validators import get_numpy
+
+
+STORAGES = ('array', 'numpy')
+
+
+class TypedStorage:
+    """Preparer storing the deserialized items of an array of numbers in
+    an `array.array` or a NumPy array, instead of a list of objects.
+    Values that do not fit the 64 bits type, or holding nulls (nullable
+    items), are kept in a list.
+    """
+
+    typecodes: t.ClassVar[t.Dict[str, str]] = {'integer': 'q', 'number': 'd'}
+
+    def __init__(self, storage: str, type: str):
+        if storage not in STORAGES:
+            raise ValueError(
+                f'Unknown storage {storage!r}, expected one of {STORAGES}.')
+        if storage == 'numpy' and get_numpy() is None:
+            raise ImportError('The numpy storage requires NumPy.')
+        self.storage = storage
+        self.typecode = self.typecodes[type]
+
+    def __call__(self, value):
+        if not isinstance(value, list):
+            return value  # null or already stored.
+        if None in value:
+            return value  # NumPy would store nulls as nan.
+        try:
+            if self.storage == 'numpy':
+                return get_numpy().array(value, dtype=self.typecode)
+            return array.array(self.typecode, value)
+        except OverflowError:
+            return value
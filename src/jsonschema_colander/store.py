@@ -0,0 +1,129 @@
+import os
+import pickle
+import sys
+import tempfile
+import typing as t
+from importlib import metadata
+from pathlib import Path
+from .cache import CompileCache, UnstableKey, compile_cache
+from .meta import JSONField
+
+
+# Bumped when the layout of the compiled fields or their keys change.
+FORMAT = 3
+
+
+def default_version() -> str:
+    try:
+        package = metadata.version('jsonschema_colander')
+    except metadata.PackageNotFoundError:
+        package = 'dev'
+    return (
+        f'{FORMAT}-{package}-'
+        f'py{sys.version_info.major}{sys.version_info.minor}'
+    )
+
+
+class SchemaStore:
+    """On-disk store of compiled fields, keyed on the schema fingerprint
+    (see `CompileCache.key`), to be shared by worker processes.
+
+    Entries live in a directory per version: the store format, package
+    and Python versions. Entries of other versions are ignored, and
+    deleted by `prune`. Fields are pickled: only load a directory you
+    trust.
+    """
+
+    def __init__(self,
+                 directory: t.Union[str, os.PathLike],
+                 *,
+                 version: t.Optional[str] = None,
+                 cache: t.Optional[CompileCache] = compile_cache):
+        self.root = Path(directory)
+        self.version = version or default_version()
+        self.directory = self.root / self.version
+        self.cache = cache
+
+    def path(self, key: str) -> Path:
+        return self.directory / f'{key}.pickle'
+
+    def __contains__(self, key: str):
+        return self.path(key).exists()
+
+    def get(self, key: str) -> t.Optional[JSONField]:
+        try:
+            with open(self.path(key), 'rb') as f:
+                stored, field = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # Truncated or incompatible entry: compile again.
+            self.delete(key)
+            return None
+        if stored != key:
+            return None
+        return field
+
+    def set(self, key: str, field: JSONField) -> bool:
+        """Stores the field, returns False if it cannot be pickled
+        (configured validators may not be).
+        """
+        try:
+            data = pickle.dumps((key, field), pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return False
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # Written aside, then renamed: readers never see partial entries.
+        fd, temporary = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(temporary, self.path(key))
+        except BaseException:
+            os.unlink(temporary)
+            raise
+        return True
+
+    def delete(self, key: str) -> bool:
+        try:
+            self.path(key).unlink()
+        except FileNotFoundError:
+            return False
+        return True
+
+    def compile(self, schema: t.Mapping,
+                config: t.Optional[t.Mapping] = None,
+                *, name: t.Optional[str] = None,
+                required: bool = False) -> JSONField:
+        """Returns the compiled field from the cache, else from the store,
+        compiling and storing it if needed. Schemas configured with
+        values that have no stable key are compiled, not stored.
+        """
+        cache = self.cache if self.cache is not None else CompileCache(0)
+        try:
+            key = cache.key(schema, config, name=name, required=required)
+        except UnstableKey:
+            return cache.compile(
+                schema, config, name=name, required=required)
+        if (field := cache.get(key)) is not None:
+            return field
+        if (field := self.get(key)) is None:
+            field = cache.compile(
+                schema, config, name=name, required=required, key=key)
+            self.set(key, field)
+        else:
+            cache.set(key, field)
+        return field
+
+    def prune(self) -> int:
+        """Deletes the entries of other versions, returns their count."""
+        count = 0
+        if not self.root.is_dir():
+            return count
+        for directory in self.root.iterdir():
+            if directory.is_dir() and directory.name != self.version:
+                for entry in directory.iterdir():
+                    entry.unlink()
+                    count += 1
+                directory.rmdir()
+        return count
@@ -1,30 +1,22 @@
 import re
 import colander
+import collections.abc
 from functools import partial
-from typing import Optional, Dict, ClassVar, Type, Iterable, Mapping
-from .meta import JSONField, DefinitionsHolder, READONLY_WIDGET
-from .validators import NumberRange
+from typing import Optional, Dict, ClassVar, Type, Iterable, Iterator, Mapping
+from .meta import JSONField, DefinitionsHolder, SkipNone, combine, readonly
+from .validators import NumberRange, OneOf, VectorizedRange, get_numpy
+from .pool import validator_pool
 from .converter import converter
-
-
-try:
-    import deform.widget
-
-    string_widgets = {
-        "password": deform.widget.PasswordWidget,
-        "textarea": deform.widget.TextAreaWidget,
-    }
-    enum_widgets = {
-        colander.String: deform.widget.SelectWidget,
-        colander.List: deform.widget.CheckboxChoiceWidget,
-    }
-except ImportError:
-    string_widgets = {}
-    enum_widgets = {}
+from .refs import References
+from .batch import validate_batch
+from .widgets import string_widgets, enum_widgets, available
+from .storage import TypedStorage
 
 
 @converter.register("string")
 class String(JSONField):
+    __slots__ = ("format",)
+
     supported = {"string"}
     allowed = {
         "format",
@@ -44,7 +36,7 @@ class String(JSONField):
         "date-time": colander.DateTime,
     }
 
-    validators = {
+    format_validators = {
         "email": [colander.Email()],
         "uuid": [colander.uuid],
         "url": [colander.url],  # non-standard
@@ -71,27 +63,51 @@ class String(JSONField):
         elif widget := self.widgets.get(self.format):
             if isinstance(widget, colander.deferred):
                 return widget
-            if READONLY_WIDGET:
+            if available():
                 return widget(readonly=self.readonly)
             return widget()
         return super().get_widget(factory, options)
 
+    @classmethod
+    def enum(cls, values: Iterable, format: Optional[str] = None) -> tuple:
+        """Returns the enum values as deserialized by the format type:
+        dates are compared to dates. Values the format cannot deserialize
+        would not match any value, they are left out.
+        """
+        if (factory := cls.formats.get(format)) is None:
+            return tuple(values)
+        node = colander.SchemaNode(factory())
+        enum = []
+        for value in values:
+            try:
+                enum.append(node.typ.deserialize(node, value))
+            except colander.Invalid:
+                pass
+        return tuple(enum)
+
     @classmethod
     def extract(cls, params: Mapping, available: set):
         validators = []
         attributes = {}
         if {"minLength", "maxLength"} & available:
             validators.append(
-                colander.Length(
-                    min=params.get("minLength", -1), max=params.get("maxLength", -1)
+                validator_pool.get(
+                    colander.Length,
+                    min=params.get("minLength", -1),
+                    max=params.get("maxLength", -1),
                 )
             )
         if "default" in available:
             attributes["default"] = params.get("default")
         if "pattern" in available:
-            validators.append(colander.Regex(params["pattern"]))
+            validators.append(validator_pool.get(colander.Regex, params["pattern"]))
         if "enum" in available:
             attributes["choices"] = [(v, v) for v in params["enum"]]
+            validators.append(
+                validator_pool.get(
+                    OneOf, cls.enum(params["enum"], params.get("format"))
+                )
+            )
         if "format" in available:
             format = attributes["format"] = params["format"]
             if format == "binary":
@@ -102,7 +118,7 @@ class String(JSONField):
                     kw = attributes.get("render_kw", {})
                     kw["accept"] = ctype
                     attributes["render_kw"] = kw
-            elif format_validators := cls.validators.get(format):
+            elif format_validators := cls.format_validators.get(format):
                 validators.extend(format_validators)
         return validators, attributes
 
@@ -110,6 +126,8 @@ class String(JSONField):
 @converter.register("integer")
 @converter.register("number")
 class Number(JSONField):
+    __slots__ = ()
+
     supported = {"integer", "number"}
     allowed = {
         "enum",
@@ -136,7 +154,8 @@ class Number(JSONField):
             attributes["default"] = default
         if {"minimum", "maximum", "exclusiveMinimum", "exclusiveMaximum"} & available:
             validators.append(
-                NumberRange(
+                validator_pool.get(
+                    NumberRange,
                     min=params.get("minimum", None),
                     max=params.get("maximum", None),
                     exclusive_min=params.get("exclusiveMinimum", None),
@@ -145,11 +164,14 @@ class Number(JSONField):
             )
         if "enum" in available:
             attributes["choices"] = [(v, v) for v in params["enum"]]
+            validators.append(validator_pool.get(OneOf, tuple(params["enum"])))
         return validators, attributes
 
 
 @converter.register("boolean")
 class Boolean(JSONField):
+    __slots__ = ()
+
     supported = {"boolean"}
 
     @classmethod
@@ -166,12 +188,23 @@ class Boolean(JSONField):
 
 @converter.register("array")
 class Array(JSONField):
+    __slots__ = ("subfield", "references")
+
     supported = {"array"}
-    allowed = {"items", "minItems", "maxItems", "default", "definitions"}
-    subfield: Optional[JSONField] = None
+    allowed = {
+        "items",
+        "minItems",
+        "maxItems",
+        "default",
+        "definitions",
+        "$defs",
+    }
+    subfield: Optional[JSONField]
+    references: Optional[References]
 
     def __init__(self, *args, subfield=None, **kwargs):
         self.subfield = subfield
+        self.references = None
         super().__init__(*args, **kwargs)
 
     def get_factory(self):
@@ -193,16 +226,133 @@ class Array(JSONField):
                 return widget(values=self.attributes["choices"], readonly=self.readonly)
         return super().get_widget(factory, options)
 
+    def vectorized_range(self) -> Optional[NumberRange]:
+        """Range of the number items checked at once on the whole array,
+        with the `vectorize` configuration and NumPy installed.
+        """
+        if not isinstance(self.subfield, Number):
+            return None
+        if not self.fieldconf.get("vectorize", self.config.get("vectorize", False)):
+            return None
+        if get_numpy() is None:
+            return None
+        ranges = [
+            validator
+            for validator in self.subfield.validators
+            if isinstance(validator, NumberRange)
+        ]
+        if len(ranges) == 1:
+            return ranges[0]
+        return None
+
+    def get_storage(self) -> Optional[TypedStorage]:
+        """Preparer of the `storage` configured for an array of numbers."""
+        if (storage := self.fieldconf.get("storage")) is None:
+            return None
+        if not isinstance(self.subfield, Number):
+            raise NotImplementedError(
+                f"Storage {storage!r} is only supported for arrays of numbers."
+            )
+        return TypedStorage(storage, self.subfield.type)
+
     def __call__(self):
+        if self.subfield is not None:
+            return self.build(self.subfield())
         factory = self.get_factory()
         options = self.get_options()
+        widget = self.lookup_widget(factory, options)
+        return self.finalize(
+            colander.SchemaNode(factory(), widget=widget, **options)
+        )
+
+    def build(self, subnode: colander.SchemaNode) -> colander.SchemaNode:
+        """Builds the sequence node around the node of the items."""
+        factory = self.get_factory()
+        options = self.get_options()
+        if (storage := self.get_storage()) is not None:
+            options["preparer"] = storage
+        if not subnode.name:
+            subnode.name = "item"
+        if (range_ := self.vectorized_range()) is not None:
+            validator = combine(
+                [v for v in self.subfield.validators if v is not range_]
+            )
+            if validator is not None and self.subfield.nullable:
+                validator = SkipNone(validator)
+            subnode.validator = validator
+            options["validator"] = VectorizedRange(
+                range_, options.get("validator")
+            )
+        return self.finalize(factory(subnode, **options))
+
+    def subfields(self):
+        if self.subfield is not None:
+            return (self.subfield,)
+        return ()
+
+    def bind_node(self, node, container, kw):
+        if self.subfield is not None:
+            # Items are positioned under the parent of the array.
+            self.subfield.bind_node(node.children[0], container, kw)
+        super().bind_node(node, container, kw)
+
+    def iter_deserialize(self, items: Iterable) -> Iterator:
+        """Deserializes the items one by one, yielding `(index, appstruct)`
+        or `(index, error)` tuples. Errors are raised by the array node,
+        as with a whole deserialization. Every item, valid or not, counts
+        for the length constraints: the maximal length is checked as soon
+        as it is exceeded, the minimal one once the items are exhausted.
+        """
+        if self.subfield is None:
+            raise NotImplementedError(
+                "Unsupported array type : 'items' attribute required."
+            )
+        node = self.get_node(shared=True)
+        subnode = node.children[0]
+        deserialize = self.subfield.get_deserializer()
+        range_ = self.vectorized_range()
+        lengths = [
+            validator for validator in self.validators
+            if isinstance(validator, colander.Length)
+        ]
+        maximum = min(
+            (length.max for length in lengths if length.max is not None),
+            default=None,
+        )
+        drop_null = subnode.missing is colander.drop
+        count = 0
+        for index, item in enumerate(items):
+            if item is colander.drop or (item is colander.null and drop_null):
+                continue
+            try:
+                appstruct = deserialize(item)
+                if appstruct is not colander.drop and range_ is not None:
+                    range_(subnode, appstruct)
+            except colander.Invalid as exc:
+                error = colander.Invalid(node)
+                error.add(exc, index)
+                result = error
+            else:
+                if appstruct is colander.drop:
+                    continue
+                result = appstruct
+            count += 1
+            if maximum is not None and count > maximum:
+                break
+            yield index, result
+
+        for length in lengths:
+            length(node, range(count))
+
+    def relocate(self, parent, name, required):
+        field = super().relocate(parent, name, required)
         if self.subfield is not None:
-            subfield = self.subfield()
-            if not subfield.name:
-                subfield.name = "item"
-            return factory(subfield, **options)
-        widget = self.get_widget(factory, options)
-        return colander.SchemaNode(factory(), widget=widget, **options)
+            field.subfield = self.subfield.relocate(
+                parent, self.subfield.name, self.subfield.required
+            )
+            if field.subfield is None:
+                return None
+        return field
 
     @classmethod
     def extract(cls, params: Mapping, available: set):
@@ -210,8 +360,10 @@ class Array(JSONField):
         validators = []
         if {"minItems", "maxItems"} & available:
             validators.append(
-                colander.Length(
-                    min=params.get("minItems", -1), max=params.get("maxItems", -1)
+                validator_pool.get(
+                    colander.Length,
+                    min=params.get("minItems", -1),
+                    max=params.get("maxItems", -1),
                 )
             )
             attributes["min_len"] = params.get("minItems", 0)
@@ -226,17 +378,24 @@ class Array(JSONField):
             self.subfield = None
             return
 
-        if ref := items.get("$ref"):
+        ref = items.get("$ref")
+        if ref:
             definitions = self.get_definitions(self.parent)
-            if not definitions:
-                raise NotImplementedError("Missing definitions.")
-            items = definitions[ref.split("/")[-1]]
+            items = self.references.resolve(ref, definitions)
 
         if "enum" in items:
             self.attributes["choices"] = [(v, v) for v in items["enum"]]
+        elif ref:
+            self.subfield = self.references.compile(
+                ref,
+                name="items",
+                required=False,
+                parent=self.parent,
+                config=self.config,
+                definitions=definitions,
+            )
         else:
-            subtype = items["type"]
-            self.subfield = converter.lookup(subtype).from_json(
+            self.subfield = converter.dispatch(items).from_json(
                 items,
                 name="items",
                 required=False,
@@ -247,13 +406,66 @@ class Array(JSONField):
     @classmethod
     def from_json(cls, params: Mapping, **kwargs):
         node = super().from_json(params, **kwargs)
-        inherited = node.get_definitions(node.parent)
+        node.references = References.of(node.parent, params)
         node.set_items(params.get("items"))
         return node
 
 
+class LazyFields(collections.abc.Mapping):
+    """Fields of an object, compiled on first access.
+
+    Fields are compiled in the `$ref` scope of the object (the targets
+    being compiled and the expansion level): recursive references are
+    detected as if the object had been compiled eagerly.
+    """
+
+    __slots__ = ("field", "properties", "requirements", "compiled", "scope")
+
+    def __init__(self, field, properties, requirements, scope=None):
+        self.field = field
+        self.properties = properties
+        self.requirements = frozenset(requirements)
+        self.compiled = {}
+        if scope is None:
+            references = field.references
+            scope = (tuple(references.compiling.values()), references.level)
+        self.scope = scope
+
+    def __getitem__(self, property_name):
+        if (field := self.compiled.get(property_name)) is None:
+            definition = self.properties[property_name]
+            references = self.field.references
+            with references.lock:
+                if (field := self.compiled.get(property_name)) is None:
+                    compiling, level = references.compiling, references.level
+                    references.compiling = compiling | {
+                        id(target): target for target in self.scope[0]
+                    }
+                    references.level = self.scope[1]
+                    try:
+                        field = self.compiled[property_name] = (
+                            self.field.compile_field(
+                                property_name,
+                                definition,
+                                property_name in self.requirements,
+                            )
+                        )
+                    finally:
+                        references.compiling = compiling
+                        references.level = level
+        return field
+
+    def __iter__(self):
+        return iter(self.properties)
+
+    def __len__(self):
+        return len(self.properties)
+
+
 @converter.register("object")
 class Object(JSONField, DefinitionsHolder):
+    __slots__ = ("fields", "definitions", "references")
+
     ignore = JSONField.ignore | {
         "$id",
         "id",
@@ -261,10 +473,23 @@ class Object(JSONField, DefinitionsHolder):
         "$comment",
     }
     supported = {"object"}
-    allowed = {"required", "properties", "definitions", "dependentRequired"}
+    allowed = {
+        "required",
+        "properties",
+        "definitions",
+        "$defs",
+        "dependentRequired",
+    }
+
+    fields: Optional[Mapping[str, JSONField]]
+    definitions: Optional[Dict]
+    references: Optional[References]
 
-    fields: Optional[Dict[str, JSONField]] = None
-    definitions: Optional[Dict] = None
+    def __init__(self, *args, **kwargs):
+        self.fields = None
+        self.definitions = None
+        self.references = None
+        super().__init__(*args, **kwargs)
 
     def get_factory(self):
         if self.factory is not None:
@@ -272,47 +497,135 @@ class Object(JSONField, DefinitionsHolder):
         return colander.Schema
 
     def __call__(self, **kwargs):
-        options = self.get_options()
-        factory = self.get_factory()
-        return factory(
-            *[subfield() for subfield in self.fields.values()], **(options | kwargs)
+        return self.build(
+            [subfield() for subfield in self.fields.values()], **kwargs
         )
 
-    def set_fields(self, properties, requirements):
+    def build(self, children: Iterable[colander.SchemaNode], **kwargs):
+        """Builds the mapping node holding the nodes of the fields."""
+        options = self.get_options()
+        factory = self.get_factory()
+        node = factory(**(options | kwargs))
+        if node.children:
+            # Declared children: let colander replace them by name.
+            for child in children:
+                node[child.name] = child
+        else:
+            # Property names are unique: colander's check of each name
+            # against all the previous children is not needed.
+            node.children.extend(children)
+        return self.finalize(node)
+
+    def bind_node(self, node, container, kw):
+        value = None
+        if isinstance(container, Mapping):
+            value = container.get(self.name)
+        if not self.__path__:
+            value = container  # Unnamed root, the fields are at the top.
+        for child in node.children:
+            self.fields[child.name].bind_node(child, value, kw)
+        super().bind_node(node, container, kw)
+
+    def subfields(self):
+        if self.fields is None:
+            return ()
+        return self.fields.values()
+
+    def materialize(self):
+        super().materialize()
+        if self.fields is not None:
+            # Compiles the lazy fields.
+            self.fields = readonly({name: self.fields[name] for name in self.fields})
+        if self.definitions is not None:
+            self.definitions = readonly(self.definitions)
+
+    def validate_batch(self, cstructs: Iterable, **kwargs):
+        """Validates many cstructs at once, see `batch.validate_batch`."""
+        return validate_batch(self, cstructs, **kwargs)
+
+    def relocate(self, parent, name, required):
+        field = super().relocate(parent, name, required)
+        for key in ("include", "exclude"):
+            if field.fieldconf.get(key) != self.fieldconf.get(key):
+                return None  # Different projection.
+        if isinstance(self.fields, LazyFields):
+            field.fields = LazyFields(
+                field,
+                self.fields.properties,
+                self.fields.requirements,
+                self.fields.scope,
+            )
+            return field
         fields = {}
+        for property_name, subfield in self.fields.items():
+            subfield = subfield.relocate(field, property_name, subfield.required)
+            if subfield is None:
+                return None
+            fields[property_name] = subfield
+        field.fields = fields
+        return field
+
+    def compile_field(self, property_name, definition, required):
+        if ref := definition.get("$ref"):
+            return self.references.compile(
+                ref,
+                name=property_name,
+                required=required,
+                parent=self,
+                config=self.config,
+                definitions=self.definitions,
+            )
+        if definition.get("type", None):
+            return converter.dispatch(definition).from_json(
+                definition,
+                name=property_name,
+                required=required,
+                parent=self,
+                config=self.config,
+            )
+        raise NotImplementedError(f"Undefined type for property {property_name}")
+
+    def select(self, properties: Mapping) -> Dict[str, Mapping]:
+        """Returns the properties projected by the `include` and `exclude`
+        field configuration.
+        """
         if includes := self.fieldconf.get("include"):
             include = set(includes)
         else:
             include = set(properties.keys())
         if exclude := self.fieldconf.get("exclude"):
             include = include - set(exclude)
-        for property_name, definition in properties.items():
-            if property_name not in include:
-                continue
-            if ref := definition.get("$ref"):
-                if not self.definitions:
-                    raise NotImplementedError("Missing definitions.")
-                definition = self.definitions[ref.split("/")[-1]]
-            if type_ := definition.get("type", None):
-                field = converter.lookup(type_)
-                fields[property_name] = field.from_json(
-                    definition,
-                    name=property_name,
-                    required=property_name in requirements,
-                    parent=self,
-                    config=self.config,
-                )
-            else:
-                raise NotImplementedError(
-                    f"Undefined type for property {property_name}"
-                )
-        self.fields = fields
+        return {
+            property_name: definition
+            for property_name, definition in properties.items()
+            if property_name in include
+        }
+
+    def set_fields(self, properties, requirements):
+        properties = self.select(properties)
+        if self.fieldconf.get("lazy", self.config.get("lazy", False)):
+            self.fields = LazyFields(self, properties, requirements)
+            return
+        self.fields = {
+            property_name: self.compile_field(
+                property_name, definition, property_name in requirements
+            )
+            for property_name, definition in properties.items()
+        }
 
     @classmethod
     def from_json(cls, params: Mapping, **kwargs):
         node = super().from_json(params, **kwargs)
         inherited = node.get_definitions(node.parent)
-        node.definitions = inherited | params.get("definitions", {})
+        if "$defs" in params or "definitions" in params:
+            node.definitions = (
+                inherited
+                | params.get("$defs", {})
+                | params.get("definitions", {})
+            )
+        else:
+            node.definitions = inherited
+        node.references = References.of(node.parent, params)
         node.set_fields(
             params.get("properties", {}),
             params.get("required", []),
@@ -1,5 +1,18 @@
 import math
 import colander
+from functools import lru_cache
+from types import ModuleType
+from typing import Optional
+
+
+@lru_cache(maxsize=None)
+def get_numpy() -> Optional[ModuleType]:
+    """Imports NumPy on first use, returns None if it is not installed."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
 
 
 class NumberRange(colander.Range):
@@ -43,3 +56,90 @@ class NumberRange(colander.Range):
                         'val': value, 'max': self.exclusive_max
                     }
                 ))
+
+
+class OneOf(colander.OneOf):
+    """`colander.OneOf` checking the membership in a frozenset.
+    Unhashable choices are compared one by one.
+    """
+
+    def __init__(self, choices, msg_err=colander.OneOf._MSG_ERR):
+        super().__init__(choices, msg_err=msg_err)
+        hashable, unhashable = [], []
+        for choice in choices:
+            try:
+                hash(choice)
+            except TypeError:
+                unhashable.append(choice)
+            else:
+                hashable.append(choice)
+        self.members = frozenset(hashable)
+        self.others = tuple(unhashable)
+
+    def __contains__(self, value):
+        try:
+            if value in self.members:
+                return True
+        except TypeError:
+            pass  # Unhashable value, only equal to unhashable choices.
+        return any(value == choice for choice in self.others)
+
+    def __call__(self, node, value):
+        if value not in self:
+            choices = ', '.join(['%s' % x for x in self.choices])
+            err = colander._(
+                self.msg_err, mapping={'val': value, 'choices': choices})
+            raise colander.Invalid(node, err)
+
+
+class VectorizedRange:
+    """Checks a `NumberRange` on all the items of a numeric sequence in
+    a single NumPy pass. Errors are only built for the failing items,
+    positioned as colander does when validating the items one by one.
+
+    As a validator of the sequence node, it only runs once all the items
+    deserialized successfully. The `validator` of the sequence, if any,
+    runs afterwards, when all the items are in range.
+    """
+
+    def __init__(self, range: NumberRange, validator=None):
+        self.range = range
+        self.validator = validator
+
+    def failing(self, value):
+        numpy = get_numpy()
+        try:
+            values = numpy.asarray(value)
+        except (TypeError, ValueError, OverflowError):
+            values = None
+        if values is None or values.ndim != 1 or values.dtype.kind not in 'iuf':
+            # Not a plain numeric vector: validate the items one by one.
+            return range(len(value))
+        rng = self.range
+        invalid = numpy.zeros(values.shape, dtype=bool)
+        if rng.min is not None:
+            invalid |= values < rng.min
+        if rng.exclusive_min is not None:
+            invalid |= values <= rng.exclusive_min
+        if rng.max is not None:
+            invalid |= values > rng.max
+        if rng.exclusive_max is not None:
+            invalid |= values >= rng.exclusive_max
+        return numpy.flatnonzero(invalid).tolist()
+
+    def __call__(self, node, value):
+        error = None
+        subnode = node.children[0]
+        for index in self.failing(value):
+            if value[index] is None:
+                continue  # Nullable items are not validated.
+            try:
+                self.range(subnode, value[index])
+            except colander.Invalid as exc:
+                if error is None:
+                    error = colander.Invalid(node)
+                error.add(exc, index)
+        if error is not None:
+            raise error
+        if self.validator is not None:
+            self.validator(node, value)
@@ -0,0 +1,71 @@
+import collections.abc
+import colander
+import typing as t
+from functools import lru_cache
+from types import ModuleType
+
+
+@lru_cache(maxsize=None)
+def load() -> t.Optional[ModuleType]:
+    """Imports deform, on first widget request. Returns None if it is not
+    installed. Call it at startup to load the widgets eagerly.
+    """
+    try:
+        import deform.schema
+        import deform.widget
+    except ImportError:
+        return None
+    return deform
+
+
+def available() -> bool:
+    return load() is not None
+
+
+class LazyWidgets(collections.abc.MutableMapping):
+    """Mapping of widgets, computed from deform on first access.
+    Empty if deform is not installed. Widgets can be registered: the
+    deform ones are loaded first.
+    """
+
+    __slots__ = ('loader', 'widgets')
+
+    def __init__(self, loader: t.Callable[[ModuleType], t.Mapping]):
+        self.loader = loader
+        self.widgets = None
+
+    def load(self) -> t.Mapping:
+        if self.widgets is None:
+            deform = load()
+            self.widgets = {} if deform is None else self.loader(deform)
+        return self.widgets
+
+    def __getitem__(self, key):
+        return self.load()[key]
+
+    def __setitem__(self, key, widget):
+        self.load()[key] = widget
+
+    def __delitem__(self, key):
+        del self.load()[key]
+
+    def __iter__(self):
+        return iter(self.load())
+
+    def __len__(self):
+        return len(self.load())
+
+
+default_widget_makers = LazyWidgets(
+    lambda deform: deform.schema.default_widget_makers
+)
+
+string_widgets = LazyWidgets(lambda deform: {
+    "password": deform.widget.PasswordWidget,
+    "textarea": deform.widget.TextAreaWidget,
+})
+
+enum_widgets = LazyWidgets(lambda deform: {
+    colander.String: deform.widget.SelectWidget,
+    colander.List: deform.widget.CheckboxChoiceWidget,
+})
@@ -1,3 +1,4 @@
+import colander
 import json
 import pytest
 import pathlib
@@ -42,3 +43,16 @@ def refs_and_defs_schema(request):
     path = pathlib.Path(__file__).parent / 'refs_defs.json'
     with path.open('r') as fp:
         return json.load(fp)
+
+
+def deserialization_outcome(deserialize, cstruct):
+    """The deserialized value, or the errors as a dict."""
+    try:
+        return deserialize(cstruct)
+    except colander.Invalid as exc:
+        return exc.asdict()
+
+
+@pytest.fixture(scope="session")
+def outcome():
+    return deserialization_outcome
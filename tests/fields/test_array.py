@@ -1,3 +1,4 @@
+import itertools
 import pytest
 import colander
 from jsonschema_colander.types import Array
@@ -118,3 +119,179 @@ def test_files_array():
 
     schema = field()
     schema.deserialize([])
+
+
+def test_iter_deserialize():
+    field = Array.from_json({
+        "type": "array",
+        "minItems": 2,
+        "maxItems": 4,
+        "items": {
+            "type": "integer",
+            "maximum": 10
+        }
+    }, name='test', required=True)
+
+    items = iter(['1', 2, 'x', 11])
+    results = list(field.iter_deserialize(items))
+    deserializer = field.subfield.get_deserializer()
+    assert [(index, value) for index, value in results
+            if not isinstance(value, colander.Invalid)] == [(0, 1), (1, 2)]
+    assert [(index, value.asdict()) for index, value in results
+            if isinstance(value, colander.Invalid)] == [
+        (2, {'test.2': '"x" is not a number'}),
+        (3, {'test.3': '11 is greater than maximum value 10'}),
+    ]
+
+    stream = field.iter_deserialize(itertools.count())
+    assert [value for _, value in itertools.islice(stream, 4)] == [
+        0, 1, 2, 3]
+    with pytest.raises(colander.Invalid) as exc:
+        next(stream)
+    assert exc.value.asdict() == {'test': 'Longer than maximum length 4'}
+
+    # Invalid items count too.
+    stream = field.iter_deserialize(['x', 'y', 1, 'z', 2])
+    assert len(list(itertools.islice(stream, 4))) == 4
+    with pytest.raises(colander.Invalid) as exc:
+        next(stream)
+    assert exc.value.asdict() == {'test': 'Longer than maximum length 4'}
+
+    with pytest.raises(colander.Invalid) as exc:
+        list(field.iter_deserialize([1]))
+    assert exc.value.asdict() == {'test': 'Shorter than minimum length 2'}
+    assert field.subfield.get_deserializer() is deserializer
+
+
+@pytest.mark.parametrize('items', [
+    {"type": "number", "minimum": 0, "exclusiveMaximum": 100},
+    {"type": "integer", "exclusiveMinimum": 0, "maximum": 100},
+])
+def test_vectorized_ranges(items, outcome):
+    pytest.importorskip('numpy')
+    schema = {"type": "array", "items": items, "maxItems": 5}
+    cstructs = [
+        ['1', '50', '99'],
+        ['0', '100', '-1', '7'],
+        ['nan', '1e300', '2', '3', '4', '5'],
+        [],
+    ]
+    field = Array.from_json(schema, name='test', required=True)
+    vectorized = Array.from_json(
+        schema, name='test', required=True, config={'vectorize': True})
+    assert field.vectorized_range() is None
+    assert vectorized.vectorized_range() is field.subfield.validators[0]
+
+    for cstruct in cstructs:
+        expected = outcome(field.get_node().deserialize, cstruct)
+        assert outcome(vectorized.get_node().deserialize, cstruct) == expected
+        if isinstance(expected, list):
+            assert vectorized.get_deserializer()(cstruct) == expected
+
+    # Ranges are checked once all the items are deserialized.
+    assert outcome(vectorized.get_node().deserialize, ['a', '-1']) == {
+        'test.0': '"a" is not a number'
+    }
+
+    streamed = dict(vectorized.iter_deserialize(['1', '-1']))
+    assert streamed[0] == 1
+    assert streamed[1].asdict() == outcome(field.get_node().deserialize, ['1', '-1'])
+
+
+def test_typed_storage():
+    import array
+    schema = {
+        "type": "array",
+        "items": {"type": "integer", "minimum": 0},
+        "maxItems": 3,
+    }
+    field = Array.from_json(
+        schema, name='test', config={'test': {'storage': 'array'}})
+    node = field.get_node()
+    appstruct = node.deserialize(['1', '2', '3'])
+    assert appstruct == array.array('q', [1, 2, 3])
+    assert field.get_deserializer()(['1', '2']) == array.array('q', [1, 2])
+    assert node.deserialize(colander.null) is colander.drop
+    assert node.deserialize([str(2 ** 70)]) == [2 ** 70]
+
+    with pytest.raises(colander.Invalid) as exc:
+        node.deserialize(['1', '2', '3', '4'])
+    assert exc.value.asdict() == {'test': 'Longer than maximum length 3'}
+
+    with pytest.raises(colander.Invalid) as exc:
+        node.deserialize(['-1'])
+    assert exc.value.asdict() == {
+        'test.0': '-1 is less than minimum value 0'
+    }
+
+    with pytest.raises(ValueError):
+        Array.from_json(
+            schema, name='test', config={'test': {'storage': 'set'}})()
+
+    with pytest.raises(NotImplementedError):
+        Array.from_json(
+            {"type": "array", "items": {"type": "string"}},
+            name='test', config={'test': {'storage': 'array'}})()
+
+
+def test_numpy_storage():
+    numpy = pytest.importorskip('numpy')
+    field = Array.from_json({
+        "type": "array",
+        "items": {"type": "number", "maximum": 10},
+    }, name='test', config={'vectorize': True, 'test': {'storage': 'numpy'}})
+    appstruct = field.get_node().deserialize(['1', '2.5'])
+    assert appstruct.dtype == numpy.float64
+    assert appstruct.tolist() == [1.0, 2.5]
+
+    with pytest.raises(colander.Invalid) as exc:
+        field.get_deserializer()(['1', '20', '2'])
+    assert exc.value.asdict() == {
+        'test.1': '20.0 is greater than maximum value 10'
+    }
+
+
+def test_vectorized_nullable_items(outcome):
+    pytest.importorskip('numpy')
+
+    def positive(node, value):
+        if value <= 0:
+            raise colander.Invalid(node, 'Not positive')
+
+    schema = {
+        "type": "array",
+        "items": {"type": ["number", "null"], "minimum": 0}
+    }
+    # Items are positioned under the parent of the array.
+    field = Array.from_json(
+        schema, name='test', config={'items': {'validators': [positive]}})
+    vectorized = Array.from_json(schema, name='test', config={
+        'vectorize': True, 'items': {'validators': [positive]}})
+    assert vectorized.vectorized_range() is not None
+
+    for cstruct in ([None, '1'], [None, '2', None]):
+        for deserialize in (field.get_node().deserialize,
+                            vectorized.get_node().deserialize,
+                            vectorized.get_deserializer()):
+            assert outcome(deserialize, cstruct) == [
+                None if value is None else float(value) for value in cstruct]
+    with pytest.raises(colander.Invalid) as exc:
+        vectorized.get_deserializer()([None, '0'])
+    assert exc.value.asdict() == {'test.1': 'Not positive'}
+
+
+@pytest.mark.parametrize('storage', ['array', 'numpy'])
+@pytest.mark.parametrize('type', ['integer', 'number'])
+def test_nullable_storage(storage, type):
+    if storage == 'numpy':
+        pytest.importorskip('numpy')
+    field = Array.from_json({
+        "type": "array",
+        "items": {"type": [type, "null"]}
+    }, name='test', config={'test': {'storage': storage}})
+    for deserialize in (field.get_node().deserialize,
+                        field.get_deserializer()):
+        appstruct = deserialize(['1', None])
+        assert isinstance(appstruct, list)
+        assert appstruct == [1, None]
+        assert not isinstance(deserialize(['1', '2']), list)
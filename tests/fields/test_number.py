@@ -93,3 +93,39 @@ def test_exclusive_minmax():
         'test': '15 is greater than maximum value 15'}
 
     assert schema.deserialize(10) == 10
+
+
+def test_enum():
+    field = Number.from_json({
+        "type": "number",
+        "enum": list(range(20000))
+    }, name='test', required=True)
+
+    constraints = field.get_options()
+    hamcrest.assert_that(constraints, hamcrest.has_entries({
+        'validator': hamcrest.instance_of(
+            jsonschema_colander.validators.OneOf
+        )
+    }))
+
+    schema = field()
+    assert schema.deserialize('19999') == 19999.0
+
+    with pytest.raises(colander.Invalid) as exc:
+        schema.deserialize('-1')
+    assert exc.value.asdict()['test'].startswith(
+        '"-1.0" is not one of 0, 1, 2, ')
+
+
+def test_one_of():
+    validator = jsonschema_colander.validators.OneOf(
+        ['a', 1, [1, 2], {'a': 1}])
+    node = colander.SchemaNode(colander.String(), name='test')
+    for value in ('a', 1, 1.0, [1, 2], {'a': 1}):
+        validator(node, value)
+
+    with pytest.raises(colander.Invalid) as exc:
+        validator(node, [2])
+    assert exc.value.asdict() == {
+        'test': '"[2]" is not one of a, 1, [1, 2], {\'a\': 1}'
+    }
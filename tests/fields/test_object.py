@@ -1,6 +1,6 @@
 import pytest
 import colander
-from jsonschema_colander.types import Object
+from jsonschema_colander.types import Object, LazyFields
 
 
 def test_object():
@@ -110,3 +110,79 @@ def test_ref_object():
     assert devices.label == 'Devices'
     assert devices.name == 'devices'
     assert not devices.required
+
+
+def test_lazy_object():
+    field = Object.from_json({
+        "type": "object",
+        "properties": {
+            "name": {"type": "string"},
+            "age": {"type": "integer", "minimum": 0},
+            "address": {"$ref": "#/definitions/Address"},
+            "hidden": {"type": "string"},
+        },
+        "required": ["name"],
+        "definitions": {
+            "Address": {
+                "type": "object",
+                "properties": {
+                    "street": {"type": "string"},
+                    "city": {"type": "string"},
+                }
+            }
+        }
+    }, config={"lazy": True, "": {"exclude": ["hidden"]}})
+
+    assert isinstance(field.fields, LazyFields)
+    assert list(field.fields) == ['name', 'age', 'address']
+    assert not field.fields.compiled
+
+    name = field.fields['name']
+    assert name.required is True
+    assert field.fields['name'] is name
+    assert list(field.fields.compiled) == ['name']
+
+    address = field.fields['address']
+    assert isinstance(address.fields, LazyFields)
+    assert address.__path__ == 'address'
+    assert not address.fields.compiled
+
+    with pytest.raises(KeyError):
+        field.fields['hidden']
+
+    schema = field(name='')
+    assert schema.deserialize({
+        'name': 'Ada', 'age': 36, 'address': {'city': 'London'}
+    }) == {'name': 'Ada', 'age': 36, 'address': {'city': 'London'}}
+    assert len(field.fields.compiled) == 3
+
+
+def test_lazy_recursive_reference():
+    schema = {
+        "type": "object",
+        "definitions": {
+            "Node": {
+                "type": "object",
+                "properties": {
+                    "name": {"type": "string"},
+                    "child": {"$ref": "#/definitions/Node"},
+                }
+            }
+        },
+        "properties": {
+            "root": {"$ref": "#/definitions/Node"},
+        }
+    }
+    config = {"max_depth": 2}
+    eager = Object.from_json(schema, name='', config=config)
+    lazy = Object.from_json(schema, name='', config={**config, "lazy": True})
+    assert isinstance(lazy.fields, LazyFields)
+
+    cstruct = {'root': {'child': {'child': {'child': {'name': 'deep'}}}}}
+    with pytest.raises(colander.Invalid) as expected:
+        eager.get_node().deserialize(cstruct)
+    with pytest.raises(colander.Invalid) as exc:
+        lazy.get_node().deserialize(cstruct)
+    assert exc.value.asdict() == expected.value.asdict() == {
+        'root.child.child.child': 'Maximum depth of 2 exceeded'
+    }
@@ -1,3 +1,4 @@
+import datetime
 import pytest
 import hamcrest
 import colander
@@ -128,9 +129,32 @@ def test_enum():
     assert field.get_factory() == colander.String
 
     schema = field()
-    schema.deserialize('Dagger')
     schema.deserialize('foo')
 
+    with pytest.raises(colander.Invalid) as exc:
+        schema.deserialize('Dagger')
+    assert exc.value.asdict() == {
+        'test': '"Dagger" is not one of foo, bar'
+    }
+
+
+def test_enum_format():
+    field = String.from_json({
+        "type": "string",
+        "format": "date",
+        "enum": ['2020-01-01', '2020-02-01', 'never']
+    }, name='test', required=True)
+
+    schema = field()
+    assert schema.deserialize('2020-01-01') == datetime.date(2020, 1, 1)
+    assert field.get_deserializer()('2020-02-01') == datetime.date(2020, 2, 1)
+
+    with pytest.raises(colander.Invalid) as exc:
+        schema.deserialize('2020-03-01')
+    assert exc.value.asdict() == {
+        'test': '"2020-03-01" is not one of 2020-01-01, 2020-02-01'
+    }
+
 
 def test_unhandled_attribute():
     with pytest.raises(NotImplementedError) as exc:
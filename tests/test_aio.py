@@ -0,0 +1,115 @@
+import asyncio
+import json
+import threading
+import time
+import pytest
+from jsonschema_colander.aio import AsyncLoader
+from jsonschema_colander.cache import CompileCache
+
+
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "name": {"type": "string"},
+        "age": {"type": "integer", "minimum": 0},
+    }
+}
+
+
+class SlowCache(CompileCache):
+
+    def __init__(self):
+        super().__init__()
+        self.compiled = []
+        self.keyed = []
+
+    def key(self, *args, **kwargs):
+        self.keyed.append(threading.get_ident())
+        return super().key(*args, **kwargs)
+
+    def compile(self, schema, config=None, **kwargs):
+        self.compiled.append(threading.get_ident())
+        time.sleep(0.05)
+        return super().compile(schema, config, **kwargs)
+
+
+def test_coalesced_compile():
+    cache = SlowCache()
+    loader = AsyncLoader(cache)
+
+    async def main():
+        ticks = 0
+
+        async def tick():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.001)
+
+        ticker = asyncio.create_task(tick())
+        fields = await asyncio.gather(*(
+            loader.compile(SCHEMA, name='') for _ in range(10)
+        ))
+        ticker.cancel()
+        assert ticks > 1  # The loop was not blocked.
+        assert loader.inflight == {}
+        other = await loader.compile(SCHEMA, {'readonly': True}, name='')
+        again = await loader.compile(SCHEMA, name='', build=True)
+        return fields, other, again
+
+    fields, other, again = asyncio.run(main())
+    assert all(field is fields[0] for field in fields)
+    assert again is fields[0]
+    assert again._deserializer is not None
+    assert other is not fields[0]
+    assert len(cache.compiled) == 2
+    assert threading.get_ident() not in cache.compiled
+    assert threading.get_ident() not in cache.keyed
+    assert cache.cache_info().currsize == 2
+
+
+def test_cache_info():
+    cache = CompileCache()
+    loader = AsyncLoader(cache)
+
+    async def main():
+        field = await loader.compile(SCHEMA, name='')
+        assert cache.cache_info() == (0, 1, 128, 1)
+        key = cache.key(SCHEMA, name='')
+        assert await loader.compile(SCHEMA, name='', key=key) is field
+        assert cache.cache_info() == (1, 1, 128, 1)
+
+    asyncio.run(main())
+
+
+def test_cancelled_caller():
+    cache = SlowCache()
+    loader = AsyncLoader(cache)
+
+    async def main():
+        first = asyncio.create_task(loader.compile(SCHEMA, name=''))
+        second = asyncio.create_task(loader.compile(SCHEMA, name=''))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return await second
+
+    field = asyncio.run(main())
+    assert field.fields['age'].type == 'integer'
+    assert len(cache.compiled) == 1
+
+
+def test_load(tmp_path):
+    path = tmp_path / 'schema.json'
+    path.write_text(json.dumps(SCHEMA))
+    loader = AsyncLoader(CompileCache())
+
+    async def main():
+        loaded = await loader.load(path, name='')
+        parsed = await loader.loads(json.dumps(SCHEMA).encode(), name='')
+        return loaded, parsed
+
+    loaded, parsed = asyncio.run(main())
+    assert loaded is parsed
+    assert loaded.get_node().deserialize({'age': '3'}) == {'age': 3}
@@ -0,0 +1,43 @@
+import pytest
+from jsonschema_colander.types import Object
+
+
+RECORDS = [
+    {'firstName': f'John{i}', 'lastName': 'Doe', 'age': i - 5}
+    for i in range(40)
+]
+
+
+@pytest.mark.parametrize('backend', ['serial', 'thread', 'process'])
+def test_validate_batch(person_schema, backend):
+    field = Object.from_json(person_schema, name='')
+    results = field.validate_batch(
+        iter(RECORDS), backend=backend, max_workers=2, chunksize=7)
+
+    assert len(results) == 40
+    for i, (appstruct, errors) in enumerate(results):
+        if i < 5:
+            assert appstruct is None
+            assert errors == {
+                'age': f'{i - 5} is less than minimum value 0'}
+        else:
+            assert appstruct == RECORDS[i]
+            assert errors is None
+
+
+@pytest.mark.parametrize('backend', ['serial', 'process'])
+def test_validate_batch_bind(backend):
+    field = Object.from_json({
+        "type": "object",
+        "properties": {"name": {"type": "string"}}
+    }, name='', config={"readonly": True})
+    results = field.validate_batch(
+        [{}, {'name': 'B'}], backend=backend, bind={'data': {'name': 'A'}})
+    assert [result.appstruct for result in results] == [
+        {'name': 'A'}, {'name': 'B'}]
+
+
+def test_validate_batch_backend(person_schema):
+    field = Object.from_json(person_schema)
+    with pytest.raises(ValueError):
+        field.validate_batch([], backend='gpu')
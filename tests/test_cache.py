@@ -0,0 +1,77 @@
+import colander
+import pytest
+from jsonschema_colander.cache import CompileCache, UnstableKey, fingerprint
+from jsonschema_colander.types import Object
+
+
+def test_fingerprint_is_canonical():
+    assert fingerprint({"type": "string", "title": "A"}) == fingerprint(
+        {"title": "A", "type": "string"})
+    assert fingerprint({"type": "string"}) != fingerprint(
+        {"type": "string"}, {"": {"readonly": True}})
+
+
+def test_fingerprint_property_order(person_schema):
+    reordered = dict(person_schema, properties=dict(
+        reversed(person_schema['properties'].items())))
+    assert reordered == person_schema
+    assert fingerprint(reordered) != fingerprint(person_schema)
+
+    cache = CompileCache()
+    field = cache.compile(person_schema, name='')
+    other = cache.compile(reordered, name='')
+    assert other is not field
+    assert [child.name for child in other.get_node().children] == list(
+        reordered['properties'])
+
+
+def test_compile_cache(person_schema):
+    cache = CompileCache()
+    schema = cache.compile(person_schema)
+    assert isinstance(schema, Object)
+    assert cache.cache_info() == (0, 1, 128, 1)
+
+    assert cache.compile(dict(person_schema)) is schema
+    assert cache.cache_info() == (1, 1, 128, 1)
+
+    config = {'firstName': {'validators': [colander.luhnok]}}
+    other = cache.compile(person_schema, config=config)
+    assert other is not schema
+    assert cache.compile(person_schema, config=config) is other
+    assert cache.cache_info() == (2, 2, 128, 2)
+
+
+def test_compile_cache_unstable_key(person_schema):
+    cache = CompileCache()
+    for value in (colander.Length(max=5), lambda node, value: None):
+        config = {'firstName': {'validators': [value]}}
+        with pytest.raises(UnstableKey):
+            cache.key(person_schema, config)
+        # Compiled, not cached.
+        field = cache.compile(person_schema, config=config)
+        assert cache.compile(person_schema, config=config) is not field
+        assert cache.invalidate(person_schema, config) is False
+    assert cache.cache_info() == (0, 0, 128, 0)
+
+    config = {'firstName': {'validators': [colander.Length(max=5)]}}
+    field = cache.compile(person_schema, config=config, key='length-5')
+    assert cache.compile(person_schema, config=config, key='length-5') is field
+
+
+def test_compile_cache_eviction(person_schema, address_schema):
+    cache = CompileCache(maxsize=1)
+    person = cache.compile(person_schema)
+    cache.compile(address_schema)
+    assert len(cache) == 1
+    assert cache.compile(person_schema) is not person
+
+
+def test_compile_cache_invalidation(person_schema):
+    cache = CompileCache()
+    person = cache.compile(person_schema)
+    assert cache.invalidate(person_schema) is True
+    assert cache.invalidate(person_schema) is False
+    assert cache.compile(person_schema) is not person
+
+    cache.clear()
+    assert cache.cache_info() == (0, 0, 128, 0)
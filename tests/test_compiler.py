@@ -0,0 +1,83 @@
+import pytest
+import colander
+from jsonschema_colander.compiler import compile_deserializer
+from jsonschema_colander.types import Object
+
+
+@pytest.mark.parametrize('cstruct', [
+    {'firstName': 'John', 'lastName': 'Doe', 'age': 42},
+    {'firstName': 'John', 'age': -1, 'homepage': ''},
+    {'firstName': 'John', 'lastName': 'Doe', 'age': 'old'},
+    {'firstName': 'John', 'lastName': 'Doe', 'unknown': 1},
+    {},
+    [],
+    'John',
+    colander.null,
+])
+def test_compiled_deserializer(person_schema, cstruct, outcome):
+    field = Object.from_json(person_schema, name='person')
+    node = field.get_node(shared=True)
+    assert outcome(field.get_deserializer(), cstruct) == (
+        outcome(node.deserialize, cstruct))
+
+
+@pytest.mark.parametrize('cstruct', [
+    {'name': 'A', 'devices': [{'kind': 'PC', 'tags': ['a']}]},
+    {'name': 'A', 'devices': [{'tags': 'a'}, {'kind': 1, 'tags': [None]}]},
+    {'name': 'A', 'devices': [{'kind': 'PC', 'tags': ['a', 'b', 'c']}]},
+    {'name': 'A', 'devices': {'kind': 'PC'}},
+    {'name': 'A', 'devices': None},
+])
+def test_compiled_nested_deserializer(cstruct, outcome):
+    field = Object.from_json({
+        "type": "object",
+        "properties": {
+            "name": {"type": "string"},
+            "devices": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "kind": {"type": "string", "minLength": 2},
+                        "tags": {
+                            "type": "array",
+                            "maxItems": 2,
+                            "items": {"type": "string"}
+                        }
+                    },
+                    "required": ["kind"]
+                }
+            }
+        },
+        "required": ["name", "devices"],
+    }, name='')
+    node = field()
+    assert outcome(compile_deserializer(node), cstruct) == (
+        outcome(node.deserialize, cstruct))
+
+
+def test_compiled_unknown_and_deferred(outcome):
+    field = Object.from_json({
+        "type": "object",
+        "properties": {
+            "name": {"type": "string"},
+        }
+    }, name='', config={'readonly': True})
+
+    node = field()
+    node.typ.unknown = 'raise'
+    deserializer = compile_deserializer(node)
+    for cstruct in ({}, {'name': 'A', 'other': 1}, {'name': 'A'}):
+        assert outcome(deserializer, cstruct) == (
+            outcome(node.deserialize, cstruct))
+
+    bound = node.bind(data={'name': 'B'})
+    assert compile_deserializer(bound)({}) == {'name': 'B'}
+
+
+def test_deserializer_is_memoized(person_schema):
+    field = Object.from_json(person_schema)
+    deserializer = field.get_deserializer()
+    assert field.get_deserializer() is deserializer
+    field.reset_node()
+    assert field.get_deserializer() is not deserializer
@@ -0,0 +1,63 @@
+import pickle
+import colander
+from jsonschema_colander.config import Configuration, EMPTY
+from jsonschema_colander.types import Object
+
+
+def test_configuration_patterns():
+    config = Configuration({
+        'readonly': True,
+        'address.*': {'readonly': False, 'a': 1},
+        'address.city': {'a': 2},
+        '**.price': {'b': 1},
+        'lines.*.price': {'b': 2},
+        'lines.item[0-9].*': {'c': 1},
+    })
+    assert config['readonly'] is True
+    assert len(config) == 6
+
+    assert config.fieldconf('address.street') == {'readonly': False, 'a': 1}
+    assert config.fieldconf('address.city') == {'readonly': False, 'a': 2}
+    assert config.fieldconf('address') is EMPTY
+    assert config.fieldconf('address.city.zip') is EMPTY
+
+    assert config.fieldconf('price') == {'b': 1}
+    assert config.fieldconf('a.b.price') == {'b': 1}
+    assert config.fieldconf('lines.item1.price') == {'b': 2, 'c': 1}
+    assert config.fieldconf('lines.other.price') == {'b': 2}
+    assert config.fieldconf('readonly') is EMPTY
+
+    assert config.fieldconf('address.city') is config.fieldconf(
+        'address.city')
+    assert Configuration.of(config) is config
+
+
+def test_configured_fields():
+    config = Configuration({
+        'readonly': True,
+        'address.*': {'readonly': False},
+        'address.zip': {'validators': [colander.Length(max=5)]},
+    })
+    field = Object.from_json({
+        "type": "object",
+        "properties": {
+            "name": {"type": "string"},
+            "address": {
+                "type": "object",
+                "properties": {
+                    "city": {"type": "string"},
+                    "zip": {"type": "string"},
+                }
+            }
+        }
+    }, config=config)
+    assert field.config is config
+    assert field.fields['name'].readonly is True
+    assert field.fields['address'].readonly is True
+    address = field.fields['address'].fields
+    assert address['city'].readonly is False
+    assert len(address['zip'].validators) == 1
+
+    clone = pickle.loads(pickle.dumps(field))
+    assert clone.config['address.*'] == {'readonly': False}
+    assert clone.fields['address'].fields['city'].readonly is False
@@ -0,0 +1,108 @@
+import pytest
+import colander
+from jsonschema_colander.converter import Converter, converter
+from jsonschema_colander.meta import JSONField, NullableType, NullableSequence
+from jsonschema_colander.types import Object, String, Number
+
+
+def test_lookup():
+    assert converter.lookup('string') is String
+    assert converter.lookup(['string', 'null']) is String
+    assert converter.lookup(['null', 'integer']) is Number
+    assert converter.lookup('string', format='email') is String
+    assert ('string', 'email', False) in converter.table
+    assert converter.dispatch({"type": ["object", "null"]}) is Object
+
+    with pytest.raises(NotImplementedError) as exc:
+        converter.lookup(['string', 'integer'])
+    assert str(exc.value) == (
+        "Unsupported type union: ['string', 'integer']."
+    )
+    with pytest.raises(KeyError):
+        converter.lookup('null')
+
+
+def test_format_registration():
+    local = Converter()
+    local.register('string')(String)
+    assert local.lookup('string', format='password') is String
+
+    @local.register('string', format='password')
+    class Password(String):
+        pass
+
+    assert local.lookup('string', format='password') is Password
+    assert local.lookup(['string', 'null'], format='password') is Password
+    assert local.lookup('string') is String
+
+
+def test_frozen_attributes():
+    assert isinstance(String.allowed, frozenset)
+    assert isinstance(Object.ignore, frozenset)
+    assert Object.accepted == Object.ignore | Object.allowed
+    assert 'format' in String.accepted
+    assert 'format' not in JSONField.accepted
+
+
+def test_nullable():
+    field = Object.from_json({
+        "type": "object",
+        "properties": {
+            "name": {"type": ["string", "null"], "maxLength": 3},
+            "age": {"type": ["integer", "null"], "minimum": 0},
+            "tags": {
+                "type": ["array", "null"],
+                "items": {"type": "string"}
+            },
+            "address": {
+                "type": ["null", "object"],
+                "properties": {"city": {"type": "string"}}
+            }
+        },
+        "required": ["name", "address"]
+    }, name='')
+    name = field.fields['name']
+    assert (name.type, name.nullable) == ('string', True)
+    assert field.nullable is False
+
+    node = field.get_node()
+    assert isinstance(node['name'].typ, NullableType)
+    assert node['tags'].typ.accept_scalar is False
+    nulls = {'name': None, 'age': None, 'tags': None, 'address': None}
+    assert node.deserialize(nulls) == nulls
+    assert field.get_deserializer()(nulls) == nulls
+    assert node.deserialize({
+        'name': 'Bob', 'age': '3', 'tags': ['a'], 'address': {'city': 'X'}
+    }) == {
+        'name': 'Bob', 'age': 3, 'tags': ['a'], 'address': {'city': 'X'}
+    }
+    assert node.serialize(nulls)['name'] is None
+
+    for deserialize in (node.deserialize, field.get_deserializer()):
+        with pytest.raises(colander.Invalid) as exc:
+            deserialize({'name': 'Robert', 'age': '-1'})
+        assert exc.value.asdict() == {
+            'name': 'Longer than maximum length 3',
+            'age': '-1 is less than minimum value 0',
+            'address': 'Required',
+        }
+
+
+def test_nullable_array_errors():
+    field = Object.from_json({
+        "type": "object",
+        "properties": {
+            "tags": {
+                "type": ["array", "null"],
+                "items": {"type": "string", "maxLength": 2}
+            }
+        }
+    }, name='')
+    node = field.get_node()
+    assert isinstance(node['tags'].typ, NullableSequence)
+    for deserialize in (node.deserialize, field.get_deserializer()):
+        with pytest.raises(colander.Invalid) as exc:
+            deserialize({'tags': ['ab', 'abc']})
+        assert exc.value.asdict() == {
+            'tags.1': 'Longer than maximum length 2'
+        }
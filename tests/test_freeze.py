@@ -0,0 +1,143 @@
+import copy
+import pickle
+import sys
+import threading
+import colander
+import pytest
+from jsonschema_colander.meta import Frozen, FrozenError
+from jsonschema_colander.types import Object
+
+
+SCHEMA = {
+    "type": "object",
+    "definitions": {
+        "node": {
+            "type": "object",
+            "properties": {
+                "name": {"type": "string", "maxLength": 5},
+                "children": {
+                    "type": "array",
+                    "items": {"$ref": "#/definitions/node"}
+                }
+            }
+        }
+    },
+    "properties": {
+        "kind": {"type": "string", "enum": ["a", "b"]},
+        "count": {"type": ["integer", "null"], "minimum": 0},
+        "tags": {"type": "array", "items": {"type": "string"}},
+        "tree": {"$ref": "#/definitions/node"},
+        "info": {
+            "type": "object",
+            "properties": {"note": {"type": "string"}}
+        }
+    },
+    "required": ["kind"]
+}
+
+CONFIG = {'lazy': True, 'max_depth': 3, 'info.note': {'readonly': True}}
+
+CSTRUCTS = [
+    {'kind': 'a', 'count': '1', 'tags': ['x'],
+     'tree': {'name': 'root', 'children': [{'name': 'leaf'}]}},
+    {'kind': 'c', 'count': '-1', 'tree': {'name': 'too long'}},
+    {'kind': 'b', 'count': None, 'info': {}},
+    {'tree': {'children': [{'children': [{'children': [{}]}]}]}},
+    {'kind': 'a', 'tree': {'children': [{'children': [{'children': [
+        {'children': [{}]}]}]}]}},
+]
+
+
+def test_freeze(outcome):
+    field = Object.from_json(SCHEMA, name='', config=CONFIG)
+    expected = [outcome(field.get_node().deserialize, c) for c in CSTRUCTS]
+    assert expected[-1] == {
+        'tree.children.0.children.0.children.0.children.0':
+            'Maximum depth of 3 exceeded'
+    }
+
+    assert field.freeze() is field
+    assert isinstance(field, Frozen)
+    assert isinstance(field, Object)
+    assert type(field).__name__ == 'FrozenObject'
+    tree = field.fields['tree']
+    assert isinstance(tree.fields['children'], Frozen)
+    assert isinstance(field.fields['kind'].validators, tuple)
+
+    with pytest.raises(FrozenError):
+        field.name = 'other'
+    with pytest.raises(FrozenError):
+        field.factory = colander.Mapping
+    with pytest.raises(FrozenError):
+        field.reset_node()
+    with pytest.raises(TypeError):
+        field.fields['kind'] = None
+    with pytest.raises(TypeError):
+        field.fields['kind'].attributes['choices'] = []
+
+    for cstruct, result in zip(CSTRUCTS, expected):
+        assert outcome(field.get_node().deserialize, cstruct) == result
+        assert outcome(field.get_deserializer(), cstruct) == result
+
+    # Copies are not frozen.
+    relocated = field.fields['info'].relocate(field, 'other', True)
+    assert not isinstance(relocated, Frozen)
+    assert not isinstance(copy.copy(field), Frozen)
+    relocated.name = 'renamed'
+
+    loaded = pickle.loads(pickle.dumps(field))
+    assert isinstance(loaded, Frozen)
+    assert isinstance(loaded.fields['tree'], Frozen)
+    assert loaded.fields['tree'].parent is loaded
+    for cstruct, result in zip(CSTRUCTS, expected):
+        assert outcome(loaded.get_deserializer(), cstruct) == result
+
+
+def test_concurrent_use(outcome):
+    field = Object.from_json(SCHEMA, name='', config=CONFIG)
+    reference = Object.from_json(SCHEMA, name='', config=CONFIG)
+    data = {'info': {'note': 'kept'}}
+    bound = [
+        outcome(reference.bind(data=data).deserialize, cstruct)
+        for cstruct in CSTRUCTS
+    ]
+    unbound = [
+        outcome(reference.get_deserializer(), cstruct)
+        for cstruct in CSTRUCTS
+    ]
+    field.freeze()
+
+    errors = []
+    barrier = threading.Barrier(8)
+
+    def work(worker):
+        try:
+            barrier.wait()
+            for iteration in range(50):
+                index = (worker + iteration) % len(CSTRUCTS)
+                cstruct = CSTRUCTS[index]
+                node = field.bind(data=data)
+                assert outcome(node.deserialize, cstruct) == bound[index]
+                assert outcome(
+                    field.get_deserializer(), cstruct) == unbound[index]
+                field()
+                tree = field.fields['tree']
+                tree.get_node(shared=True)
+                tree.fields['children'].get_deserializer()
+        except Exception as exc:  # pragma: no cover
+            errors.append(exc)
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        threads = [
+            threading.Thread(target=work, args=(worker,))
+            for worker in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(interval)
+    assert errors == []
@@ -0,0 +1,56 @@
+import subprocess
+import sys
+import pytest
+
+
+def run(code: str) -> str:
+    return subprocess.run(
+        [sys.executable, '-c', code],
+        check=True, capture_output=True, text=True
+    ).stdout.strip()
+
+
+def test_validation_does_not_import_widgets():
+    loaded = run('''
+import sys
+from jsonschema_colander.cache import compile_cache
+field = compile_cache.compile({
+    "type": "object",
+    "properties": {
+        "name": {"type": "string", "enum": ["a", "b"]},
+        "values": {"type": "array", "items": {"type": "number"}}
+    }
+}, {"widgets": False}, name="")
+field.get_deserializer()({"name": "a", "values": ["1"]})
+print(",".join(
+    name for name in ("deform", "numpy", "concurrent.futures")
+    if name in sys.modules
+))
+''')
+    assert loaded == ''
+
+
+def test_widgets_import_deform():
+    pytest.importorskip('deform')
+    assert run('''
+import sys
+from jsonschema_colander.types import String
+assert 'deform' not in sys.modules
+node = String.from_json({"type": "string", "format": "password"}, name="x")()
+print(type(node.widget).__name__, 'deform' in sys.modules)
+''') == 'PasswordWidget True'
+
+
+def test_register_widget():
+    pytest.importorskip('deform')
+    assert run('''
+import sys
+from jsonschema_colander.types import String
+class ColorWidget:
+    def __init__(self, **kw):
+        pass
+String.widgets['color'] = ColorWidget
+assert 'deform' in sys.modules
+node = String.from_json({"type": "string", "format": "color"}, name="x")()
+print(type(node.widget).__name__, sorted(String.widgets))
+''') == "ColorWidget ['color', 'password', 'textarea']"
@@ -0,0 +1,176 @@
+import copy
+from jsonschema_colander.incremental import recompile
+from jsonschema_colander.types import Object
+
+
+SCHEMA = {
+    "type": "object",
+    "definitions": {
+        "address": {
+            "type": "object",
+            "properties": {"city": {"type": "string"}}
+        }
+    },
+    "properties": {
+        "name": {"type": "string", "maxLength": 10},
+        "age": {"type": "integer"},
+        "home": {"$ref": "#/definitions/address"},
+        "profile": {
+            "type": "object",
+            "properties": {
+                "bio": {"type": "string"},
+                "site": {"type": "string", "format": "url"}
+            }
+        },
+        "lines": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "label": {"type": "string"},
+                    "price": {"type": "number", "minimum": 0}
+                }
+            }
+        }
+    },
+    "required": ["name"]
+}
+
+CSTRUCTS = [
+    {},
+    {'name': 'A very long name', 'age': 'x', 'home': {'city': 'Town'}},
+    {'name': 'Bob', 'profile': {'bio': 'Hi', 'site': 'nope'}},
+    {'name': 'Bob', 'lines': [{'label': 'Pen', 'price': '-1'}]},
+    {'name': 'Bob', 'lines': [{'label': 'Pen' * 10, 'price': '1'}]},
+]
+
+
+def check(field, schema, outcome):
+    expected = Object.from_json(schema, name='').get_node()
+    for cstruct in CSTRUCTS:
+        result = outcome(expected.deserialize, cstruct)
+        assert outcome(field.get_node().deserialize, cstruct) == result
+        assert outcome(field.get_deserializer(), cstruct) == result
+
+
+def compiled():
+    field = Object.from_json(SCHEMA, name='')
+    field.get_node()
+    return field
+
+
+def test_unchanged():
+    field = compiled()
+    assert recompile(field, SCHEMA, copy.deepcopy(SCHEMA)) is field
+
+
+def test_reordered_properties(outcome):
+    field = compiled()
+    schema = copy.deepcopy(SCHEMA)
+    schema['properties'] = dict(reversed(schema['properties'].items()))
+    profile = schema['properties']['profile']
+    profile['properties'] = dict(reversed(profile['properties'].items()))
+
+    result = recompile(field, SCHEMA, schema)
+    assert result is not field
+    assert [child.name for child in result._node.children] == list(
+        schema['properties'])
+    assert [child.name for child in result._node['profile'].children] == [
+        'site', 'bio']
+    assert result._node['lines'] is field._node['lines']
+    check(result, schema, outcome)
+
+
+def test_changed_property(outcome):
+    field = compiled()
+    schema = copy.deepcopy(SCHEMA)
+    schema['properties']['name']['maxLength'] = 2
+    schema['properties']['email'] = {"type": "string", "format": "email"}
+    del schema['properties']['age']
+    schema['required'] = ['name', 'home']
+
+    result = recompile(field, SCHEMA, schema)
+    assert list(result.fields) == ['name', 'home', 'profile', 'lines', 'email']
+    assert result.fields['name'] is not field.fields['name']
+    assert result.fields['profile'] is not field.fields['profile']
+    assert result.fields['profile'].parent is result
+    assert result.fields['lines'].parent is result
+    assert result.fields['home'].required is True
+    assert field.fields['home'].required is False
+
+    node, previous = result._node, field._node
+    assert node is not previous
+    assert node['profile'] is previous['profile']
+    assert node['lines'] is previous['lines']
+    assert node['home'] is not previous['home']
+    check(result, schema, outcome)
+    check(field, SCHEMA, outcome)
+
+
+def test_nested_changes(outcome):
+    field = compiled()
+    schema = copy.deepcopy(SCHEMA)
+    schema['properties']['profile']['properties']['bio']['maxLength'] = 1
+    schema['properties']['lines']['items']['properties']['label'][
+        'maxLength'] = 5
+
+    result = recompile(field, SCHEMA, schema)
+    assert result.fields['name'].parent is result
+    assert result._node['name'] is field._node['name']
+    profile = result.fields['profile']
+    assert profile is not field.fields['profile']
+    assert profile.parent is result
+    assert profile.fields['site'].parent is profile
+    assert result._node['profile']['site'] is field._node['profile']['site']
+
+    lines = result.fields['lines']
+    assert lines is not field.fields['lines']
+    items = lines.subfield
+    assert items.fields['price'].parent is items
+    assert result._node['lines'].children[0]['price'] is \
+        field._node['lines'].children[0]['price']
+    check(result, schema, outcome)
+
+
+def test_definitions_change(outcome):
+    field = compiled()
+    schema = copy.deepcopy(SCHEMA)
+    schema['definitions']['address']['properties']['zip'] = {
+        "type": "string"}
+    result = recompile(field, SCHEMA, schema)
+    assert result.fields['name'] is not field.fields['name']
+    assert 'zip' in result.fields['home'].fields
+    check(result, schema, outcome)
+
+
+def test_not_built(outcome):
+    field = Object.from_json(SCHEMA, name='')
+    schema = copy.deepcopy(SCHEMA)
+    schema['properties']['age']['minimum'] = 0
+    result = recompile(field, SCHEMA, schema)
+    assert result._node is None
+    assert result.fields['name'].parent is result
+    check(result, schema, outcome)
+
+
+def test_pointer_reference(outcome):
+    schema = copy.deepcopy(SCHEMA)
+    schema['properties']['profile']['properties']['bio']['maxLength'] = 50
+    schema['properties']['alias'] = {
+        "$ref": "#/properties/profile/properties/bio"}
+    field = Object.from_json(schema, name='')
+    field.get_node()
+
+    edited = copy.deepcopy(schema)
+    edited['properties']['profile']['properties']['bio']['maxLength'] = 2
+    result = recompile(field, schema, edited)
+    assert result.fields['alias'] is not field.fields['alias']
+    assert result.fields['alias'].parent is result
+
+    expected = Object.from_json(edited, name='').get_node()
+    for cstruct in [{'name': 'Bob', 'alias': 'abcdef'}, {'alias': 'ab'}]:
+        assert outcome(result.get_node().deserialize, cstruct) == outcome(
+            expected.deserialize, cstruct)
+    assert outcome(result.get_deserializer(), {
+        'name': 'Bob', 'alias': 'abcdef'
+    }) == {'alias': 'Longer than maximum length 2'}
@@ -0,0 +1,195 @@
+import pytest
+import colander
+from jsonschema_colander.types import Object
+
+
+def test_memoized_node(person_schema):
+    field = Object.from_json(person_schema)
+    shared = field.get_node(shared=True)
+    assert field.get_node(shared=True) is shared
+
+    node = field.get_node()
+    assert node is not shared
+    assert [child.name for child in node.children] == [
+        child.name for child in shared.children]
+    assert node.deserialize({'firstName': 'John', 'lastName': 'Doe'}) == {
+        'firstName': 'John', 'lastName': 'Doe'
+    }
+
+    node.children.pop()
+    assert len(shared.children) == 4
+
+    field.reset_node()
+    assert field.get_node(shared=True) is not shared
+
+
+def test_memoized_node_binding():
+    field = Object.from_json({
+        "type": "object",
+        "properties": {
+            "name": {"type": "string"},
+        }
+    }, config={'readonly': True})
+
+    node = field.get_node()
+    with pytest.raises(colander.Invalid):
+        node.deserialize({})
+
+    first = field.get_node().bind(data={'name': 'first'})
+    second = field.get_node().bind(data={'name': 'second'})
+    assert first.deserialize({}) == {'name': 'first'}
+    assert second.deserialize({}) == {'name': 'second'}
+    assert isinstance(
+        field.get_node(shared=True)['name'].missing, colander.deferred)
+
+
+READONLY = {
+    "type": "object",
+    "properties": {
+        "name": {"type": "string"},
+        "age": {"type": "integer"},
+        "address": {
+            "type": "object",
+            "properties": {
+                "street": {"type": "string"},
+                "city": {"type": "string"},
+            },
+            "required": ["city"]
+        },
+        "tags": {"type": "array", "items": {"type": "string"}}
+    },
+}
+
+
+@pytest.mark.parametrize('name', [None, 'form'])
+@pytest.mark.parametrize('data', [
+    {'name': 'A', 'age': 3, 'address': {'street': 'S', 'city': 'C'}},
+    {'form': {'name': 'B', 'address': {'street': 'S'}, 'tags': ['t']}},
+    {},
+    None,
+])
+def test_single_pass_bind(name, data):
+    field = Object.from_json(READONLY, name=name, config={'readonly': True})
+    cstruct = {'address': {'city': 'Z'}}
+    expected = field().bind(data=data).deserialize(cstruct)
+    assert field.bind(data=data).deserialize(cstruct) == expected
+
+
+def test_bind_like_colander():
+    class Node(colander.SchemaNode):
+        hint = colander.deferred(lambda node, kw: kw['hint'])
+
+    bound = []
+    field = Object.from_json(READONLY)
+    node = field.get_node()
+    node.__class__ = Node
+    node['name'].after_bind = lambda node, kw: bound.append(node.name)
+
+    expected = node.clone().bind(hint='Person')
+    field.bind_node(node, None, {'hint': 'Person'})
+    assert node.hint == expected.hint == 'Person'
+    assert bound == ['name', 'name']
+
+
+def test_single_pass_bind_not_a_mapping():
+    field = Object.from_json(READONLY, config={'readonly': True})
+    node = field.bind(data={'name': 'A', 'address': 'nowhere'})
+    assert node.deserialize({'address': {'city': 'Z'}}) == {
+        'name': 'A', 'age': None, 'tags': None,
+        'address': {'street': None, 'city': 'Z'}
+    }
+
+
+def test_single_pass_bind_deferred():
+    @colander.deferred
+    def maximum(node, kw):
+        return colander.Length(max=kw['maximum'])
+
+    field = Object.from_json(READONLY, config={
+        'readonly': True,
+        'name': {'validators': [maximum]},
+    })
+    node = field.bind(data={'age': 1}, maximum=2)
+    assert node['name'].bindings == {'data': {'age': 1}, 'maximum': 2}
+    assert node.deserialize({'name': 'AB'})['age'] == 1
+    with pytest.raises(colander.Invalid):
+        node.deserialize({'name': 'ABC'})
+    assert isinstance(
+        field.get_node(shared=True)['age'].missing, colander.deferred)
+
+
+WIDGETS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "kind": {"type": "string", "enum": ["PC", "Laptop"]},
+        "password": {"type": "string", "format": "password"},
+        "count": {"type": "integer"},
+    }
+}
+
+
+def test_validation_only():
+    field = Object.from_json(
+        WIDGETS_SCHEMA, name='', config={'widgets': False})
+    node = field()
+    assert [child.widget for child in node.children] == [None, None, None]
+    assert field.fields['kind']._widget is None
+    assert node.deserialize({'kind': 'PC', 'count': '1'}) == {
+        'kind': 'PC', 'count': 1
+    }
+
+    field = Object.from_json(
+        WIDGETS_SCHEMA, name='', config={'widgets': False,
+                                         'kind': {'widgets': True}})
+    assert field.fields['kind'].with_widgets is True
+    assert field.fields['count'].with_widgets is False
+
+
+def test_widget_reuse():
+    deform = pytest.importorskip('deform')
+    field = Object.from_json(WIDGETS_SCHEMA, name='')
+    first, second = field(), field()
+    for child, other in zip(first.children, second.children):
+        assert child.widget is other.widget
+    kind = first['kind'].widget
+    assert isinstance(kind, deform.widget.SelectWidget)
+    assert kind.values == [('PC', 'PC'), ('Laptop', 'Laptop')]
+
+    readonly = field.fields['kind'].relocate(field, 'kind', False)
+    readonly.readonly = True
+    widget = readonly().widget
+    assert widget is not kind
+    assert widget.readonly is True
+
+    field.fields['kind'].reset_node()
+    assert field()['kind'].widget is not kind
+
+
+def test_nullable_widgets():
+    deform = pytest.importorskip('deform')
+    field = Object.from_json({
+        "type": "object",
+        "properties": {
+            "address": {
+                "type": ["object", "null"],
+                "properties": {"city": {"type": "string"}}
+            },
+            "tags": {
+                "type": ["array", "null"],
+                "items": {"type": "string"}
+            },
+            "name": {"type": ["string", "null"]},
+        }
+    }, name='')
+    form = deform.Form(field.get_node())
+    assert [type(child.widget) for child in form.children] == [
+        deform.widget.MappingWidget,
+        deform.widget.SequenceWidget,
+        deform.widget.TextInputWidget,
+    ]
+
+    field = Object.from_json({
+        "type": "object",
+        "properties": {"address": {"type": ["object", "null"]}}
+    }, name='', config={'widgets': False})
+    assert getattr(field()['address'], 'widget', None) is None
@@ -0,0 +1,50 @@
+import pytest
+from jsonschema_colander.meta import Path, Paths
+from jsonschema_colander.types import Object
+
+
+def test_path_resolve():
+    path = Path('a.b.c')
+    assert path.fragments == ['a', 'b', 'c']
+    assert Path(path) is path
+    assert path.resolver is Path('a.b.c').resolver
+    assert path.resolve({'a': {'b': {'c': 1}}}) == 1
+    assert Path('a').resolve({'a': 2}) == 2
+    with pytest.raises(KeyError):
+        path.resolve({'a': {'b': {}}})
+
+
+def test_interned_paths():
+    field = Object.from_json({
+        "type": "object",
+        "properties": {
+            "tags": {"type": "array", "items": {"type": "string"}},
+            "codes": {"type": "array", "items": {"type": "string"}},
+            "child": {
+                "type": "object",
+                "properties": {"name": {"type": "string"}}
+            }
+        }
+    }, name='form')
+    assert isinstance(field.paths, Paths)
+    assert field.fields['child'].fields['name'].paths is field.paths
+    assert field.fields['tags'].subfield.__path__ is (
+        field.fields['codes'].subfield.__path__)
+    assert field.paths['form.child.name'] is (
+        field.fields['child'].fields['name'].__path__)
+
+
+def test_readonly_missing():
+    field = Object.from_json({
+        "type": "object",
+        "properties": {
+            "child": {
+                "type": "object",
+                "properties": {"name": {"type": "string"}}
+            }
+        }
+    }, config={'readonly': True})
+    node = field(name='').bind(data={'child': {'name': 'A'}})
+    assert node.deserialize({}) == {'child': {'name': 'A'}}
+    node = field(name='').bind(data={'child': {}})
+    assert node.deserialize({'child': {}}) == {'child': {'name': None}}
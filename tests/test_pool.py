@@ -0,0 +1,65 @@
+import colander
+import pytest
+import jsonschema_colander.types
+from jsonschema_colander.pool import ValidatorPool
+from jsonschema_colander.types import Object
+from jsonschema_colander.validators import NumberRange
+
+
+def test_pool():
+    pool = ValidatorPool(maxsize=2)
+    length = pool.get(colander.Length, min=1, max=5)
+    assert pool.get(colander.Length, max=5, min=1) is length
+    assert pool.get(colander.Length, min=1.0, max=5) is not length
+    assert pool.cache_info() == (1, 2, 2, 2)
+
+    regex = pool.get(colander.Regex, '^[0-9]+$')
+    assert pool.get(colander.Length, min=1, max=5) is not length  # evicted
+    assert pool.get(colander.Regex, '^[0-9]+$') is regex
+
+    # Unhashable parameters are not pooled.
+    choices = pool.get(colander.OneOf, [1, 2])
+    assert pool.get(colander.OneOf, [1, 2]) is not choices
+    assert len(pool) == 2
+
+    pool.clear()
+    assert pool.cache_info() == (0, 0, 2, 0)
+
+
+def test_typed_choices():
+    pool = ValidatorPool()
+    choices = pool.get(colander.OneOf, (1.5, 2))
+    assert pool.get(colander.OneOf, (1.5, 2.0)) is not choices
+    assert pool.get(colander.OneOf, (1.5, 2)) is choices
+
+
+def test_shared_validators(monkeypatch):
+    pool = ValidatorPool()
+    monkeypatch.setattr(jsonschema_colander.types, 'validator_pool', pool)
+    postcode = {"type": "string", "pattern": "^[0-9]{5}$", "maxLength": 5}
+    schema = {
+        "type": "object",
+        "properties": {
+            "home": postcode,
+            "work": postcode,
+            "age": {"type": "integer", "minimum": 0, "maximum": 150},
+            "size": {"type": "number", "minimum": 0, "maximum": 150},
+        }
+    }
+    first = Object.from_json(schema, name="")
+    second = Object.from_json(schema)
+    home, work = first.fields['home'], second.fields['work']
+    assert len(home.validators) == 2
+    assert all(a is b for a, b in zip(home.validators, work.validators))
+    assert first.fields['age'].validators[0] is \
+        first.fields['size'].validators[0]
+    assert isinstance(first.fields['age'].validators[0], NumberRange)
+    # Length, Regex and NumberRange: shared by both schemas.
+    assert pool.cache_info() == (9, 3, 1024, 3)
+
+    node = first.get_node()
+    with pytest.raises(colander.Invalid) as exc:
+        node.deserialize({"home": "1234a"})
+    assert exc.value.asdict() == {
+        'home': 'String does not match expected pattern'
+    }
@@ -0,0 +1,96 @@
+import threading
+from jsonschema_colander import profiling
+from jsonschema_colander.types import Object, String
+
+
+SCHEMA = {
+    "type": "object",
+    "definitions": {
+        "node": {
+            "type": "object",
+            "properties": {
+                "name": {"type": "string"},
+                "child": {"$ref": "#/definitions/node"}
+            }
+        }
+    },
+    "properties": {
+        "name": {"type": "string", "maxLength": 10},
+        "tags": {"type": "array", "items": {"type": "string"}},
+        "tree": {"$ref": "#/definitions/node"},
+    }
+}
+
+
+def test_disabled():
+    method = Object.__dict__['__call__']
+    assert method.__wrapped__ is not None
+    events = []
+    field = Object.from_json(SCHEMA, name='')
+    field()
+    with profiling.observe(lambda *event: events.append(event)):
+        # Observing does not patch the classes.
+        assert Object.__dict__['__call__'] is method
+    assert Object.__dict__['__call__'] is method
+    assert events == []
+
+
+def test_timings():
+    timings = profiling.Timings()
+    with profiling.observe(timings):
+        field = Object.from_json(SCHEMA, name='')
+        field()
+
+    calls = {key: calls for key, (calls, _) in timings.entries.items()}
+    assert calls[('from_json', '')] == 1
+    assert calls[('from_json', 'name')] == 1
+    assert calls[('extract', 'name')] == 1
+    assert calls[('set_fields', '')] == 1
+    assert calls[('set_items', 'tags')] == 1
+    assert calls[('from_json', 'items')] == 1
+    assert calls[('get_widget', 'name')] == 1
+    # super() calls and recursive placeholders are timed once per path.
+    assert calls[('get_factory', 'tree')] == 1
+    assert calls[('node', 'tree')] == 1
+    assert calls[('node', 'tree.child')] == 1
+
+    phases = timings.by_phase()
+    assert set(phases) == set(profiling.PHASES.values())
+    assert phases['from_json'] >= phases['set_fields']
+    path, count, seconds = timings.slowest('node', 1)[0]
+    assert (path, count) == ('', 1)
+    assert seconds == max(
+        seconds for (phase, _), (_, seconds) in timings.entries.items()
+        if phase == 'node'
+    )
+
+
+def test_context_isolation():
+    events = []
+    other = []
+
+    def compile():
+        String.from_json({"type": "string"}, name='other')
+
+    with profiling.observe(lambda *event: events.append(event)):
+        thread = threading.Thread(target=compile)
+        thread.start()
+        thread.join()
+        with profiling.observe(lambda *event: other.append(event)):
+            String.from_json({"type": "string"}, name='inner')
+        String.from_json({"type": "string"}, name='outer')
+
+    assert {path for _, path, _ in events} == {'outer'}
+    assert {path for _, path, _ in other} == {'inner'}
+
+
+def test_subclass_registration():
+    class Custom(String):
+        def get_factory(self):
+            return super().get_factory()
+
+    timings = profiling.Timings()
+    with profiling.observe(timings):
+        Custom.from_json({"type": "string"}, name='custom')()
+    assert timings.entries[('get_factory', 'custom')][0] == 1
+    assert Custom.__dict__['get_factory'].__timed__ == 'get_factory'
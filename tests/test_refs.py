@@ -0,0 +1,238 @@
+import pickle
+import pytest
+import colander
+from jsonschema_colander.refs import References, Recursive, split_pointer
+from jsonschema_colander.types import Object, String
+
+
+ADDRESS = {
+    "type": "object",
+    "properties": {
+        "street": {"type": "string"},
+        "city": {"type": "string", "maxLength": 20},
+    },
+    "required": ["street"]
+}
+
+
+def test_split_pointer():
+    assert split_pointer('#') == ()
+    assert split_pointer('#/definitions/A') == ('definitions', 'A')
+    assert split_pointer('#/$defs/a~1b/c~0d') == ('$defs', 'a/b', 'c~d')
+    assert split_pointer('#/definitions/with%20space') == (
+        'definitions', 'with space')
+
+    with pytest.raises(NotImplementedError):
+        split_pointer('other.json#/definitions/A')
+
+
+def test_references_index():
+    schema = {
+        "type": "object",
+        "properties": {
+            "a": {"$ref": "#/definitions/A/properties/b"},
+            "c": {"$ref": "#/$defs/c~1d"},
+        },
+        "definitions": {
+            "A": {"type": "object", "properties": {"b": {"type": "string"}}}
+        },
+        "$defs": {
+            "c/d": {"type": "integer"}
+        }
+    }
+    references = References(schema)
+    assert references.targets == {
+        "#/definitions/A/properties/b": {"type": "string"},
+        "#/$defs/c~1d": {"type": "integer"},
+    }
+
+    field = Object.from_json(schema)
+    assert isinstance(field.fields['a'], String)
+    assert field.fields['c'].type == 'integer'
+
+
+def test_refs_and_defs(refs_and_defs_schema):
+    field = Object.from_json(refs_and_defs_schema)
+    vegetables = field.fields['vegetables']
+    assert isinstance(vegetables.subfield, Object)
+    assert vegetables.subfield.fields['veggieName'].required is True
+
+
+def test_missing_reference():
+    with pytest.raises(NotImplementedError) as exc:
+        Object.from_json({
+            "type": "object",
+            "properties": {"a": {"$ref": "#/definitions/A"}}
+        })
+    assert str(exc.value) == 'Missing definition for #/definitions/A.'
+
+
+def test_shared_reference():
+    properties = {
+        f"address{i}": {"$ref": "#/definitions/Address"} for i in range(40)
+    }
+    field = Object.from_json({
+        "type": "object",
+        "properties": properties,
+        "required": ["address1"],
+        "definitions": {"Address": ADDRESS}
+    }, config={
+        "address2.city": {"validators": [colander.url]},
+        "address3": {"exclude": ["city"]}
+    })
+
+    assert len(field.references.compiled) == 1
+    assert field.fields['address1'].required is True
+    assert field.fields['address2'].required is False
+
+    for i in range(40):
+        address = field.fields[f'address{i}']
+        assert address.__path__ == f'address{i}'
+        assert address.parent is field
+        street = address.fields['street']
+        assert street.__path__ == f'address{i}.street'
+        assert street.parent is address
+        assert street.required is True
+
+    assert field.fields['address0'].fields['city'].validators == [
+        field.fields['address0'].fields['city'].schema_validators[0]
+    ]
+    assert field.fields['address2'].fields['city'].validators[-1] is (
+        colander.url)
+    assert list(field.fields['address3'].fields) == ['street']
+
+    node = field(name='')
+    with pytest.raises(colander.Invalid) as exc:
+        node.deserialize({'address1': {'street': 'A', 'city': 'x' * 21}})
+    assert exc.value.asdict() == {
+        'address1.city': 'Longer than maximum length 20'
+    }
+
+
+TREE = {
+    "type": "object",
+    "properties": {
+        "root": {"$ref": "#/definitions/Node"}
+    },
+    "definitions": {
+        "Node": {
+            "type": "object",
+            "properties": {
+                "name": {"type": "string"},
+                "children": {
+                    "type": "array",
+                    "items": {"$ref": "#/definitions/Node"}
+                }
+            },
+            "required": ["name"]
+        }
+    }
+}
+
+
+def nest(depth):
+    node = {'name': f'level{depth}', 'children': []}
+    for level in range(depth - 1, -1, -1):
+        node = {'name': f'level{level}', 'children': [node]}
+    return node
+
+
+def test_recursive_reference():
+    field = Object.from_json(TREE, config={'max_depth': 3})
+    children = field.fields['root'].fields['children']
+    placeholder = children.subfield
+    assert isinstance(placeholder, Recursive)
+    assert placeholder.field is None
+    assert placeholder.depth == 0
+
+    node = field(name='')
+    assert placeholder.field.fields['children'].subfield.depth == 1
+    assert node.deserialize({'root': nest(3)}) == {'root': nest(3)}
+
+    with pytest.raises(colander.Invalid) as exc:
+        node.deserialize({'root': nest(4)})
+    assert exc.value.asdict() == {
+        'root.children.0.children.0.children.0.children.0':
+        'Maximum depth of 3 exceeded'
+    }
+
+
+def test_recursive_expansions():
+    field = Object.from_json({
+        "type": "object",
+        "definitions": {
+            "Node": {
+                "type": "object",
+                "properties": {
+                    "a": {"$ref": "#/definitions/Node"},
+                    "b": {"$ref": "#/definitions/Node"},
+                    "c": {"$ref": "#/definitions/Node"}
+                }
+            }
+        },
+        "properties": {"root": {"$ref": "#/definitions/Node"}}
+    }, config={'max_expansions': 40})
+    node = field(name='')
+    placeholder = field.fields['root'].fields['a']
+    # 1 + 3 + 9 + 27 expansions, the next level would be 81.
+    assert placeholder.depth_limit == 4
+
+    def deepest(node):
+        return 1 + max(map(deepest, node.children), default=0)
+
+    # The root, its object, then 4 levels and the exceeding nodes.
+    assert deepest(node) == 7
+    assert node.deserialize({'root': {'a': {'b': {'c': {}}}}})
+    with pytest.raises(colander.Invalid) as exc:
+        node.deserialize({'root': {'a': {'b': {'c': {'a': {'b': {}}}}}}})
+    assert exc.value.asdict() == {
+        'root.a.b.c.a.b': 'Maximum depth of 4 exceeded'
+    }
+
+
+def test_mutually_recursive_references():
+    field = Object.from_json({
+        "type": "object",
+        "properties": {
+            "thread": {"$ref": "#/$defs/Thread"}
+        },
+        "$defs": {
+            "Thread": {
+                "type": "object",
+                "properties": {
+                    "comments": {
+                        "type": "array",
+                        "items": {"$ref": "#/$defs/Comment"}
+                    }
+                }
+            },
+            "Comment": {
+                "type": "object",
+                "properties": {
+                    "text": {"type": "string"},
+                    "replies": {"$ref": "#/$defs/Thread"}
+                }
+            }
+        }
+    })
+    node = field(name='')
+    data = {'thread': {'comments': [{
+        'text': 'a', 'replies': {'comments': [{'text': 'b'}]}
+    }]}}
+    assert node.deserialize(data) == data
+
+
+def test_pickled_references():
+    field = Object.from_json(TREE, config={'max_depth': 3, 'lazy': True})
+    field.fields['root']
+    loaded = pickle.loads(pickle.dumps(field))
+    references = loaded.references
+    # Targets are keyed on the identity of the loaded targets.
+    assert references.compiled
+    for key, (target, compiled) in references.compiled.items():
+        assert key == id(target)
+
+    node = loaded(name='')
+    assert node.deserialize({'root': nest(3)}) == {'root': nest(3)}
+    with pytest.raises(colander.Invalid):
+        node.deserialize({'root': nest(4)})
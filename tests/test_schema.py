@@ -1,3 +1,7 @@
+import copy
+import copyreg
+import pickle
+from types import MappingProxyType
 import hamcrest
 import colander
 import jsonschema_colander.types
@@ -48,3 +52,35 @@ def test_standalone_schema(person_schema):
 #         "age": hamcrest.instance_of(
 #             colander.typess.IntegerField),
 #     }))
+
+
+def test_compact_fields(person_schema):
+    schema = jsonschema_colander.types.Object.from_json(
+        person_schema, config={'age': {'readonly': True}})
+
+    for field in (schema, *schema.fields.values()):
+        assert not hasattr(field, '__dict__')
+        assert field.config is schema.config
+    assert not hasattr(schema.__path__, '__dict__')
+
+    firstname = schema.fields['firstName']
+    assert firstname.fieldconf is schema.fields['lastName'].fieldconf
+    assert firstname.validators is firstname.schema_validators
+    assert schema.fields['age'].readonly is True
+
+    clone = pickle.loads(pickle.dumps(schema))
+    assert clone.fields['age'].readonly is True
+    assert clone.fields['age'].fieldconf == {'readonly': True}
+    assert isinstance(clone.fields['age'].fieldconf, MappingProxyType)
+    assert clone.fields['homepage'].format == 'uri'
+    assert clone.fields['age'].parent is clone
+    assert clone.fields['age'].config is clone.config
+
+    firstname.factory = colander.Date
+    assert firstname.get_factory() is colander.Date
+
+    # Read-only views are converted by the fields only.
+    assert MappingProxyType not in copyreg.dispatch_table
+    deep = copy.deepcopy(schema)
+    assert deep.fields['age'].fieldconf == {'readonly': True}
+    assert deep.fields['age'].parent is deep
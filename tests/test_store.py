@@ -0,0 +1,84 @@
+import colander
+import pytest
+from jsonschema_colander.cache import CompileCache, UnstableKey
+from jsonschema_colander.store import SchemaStore
+
+
+SCHEMA = {
+    "type": "object",
+    "definitions": {
+        "address": {
+            "type": "object",
+            "properties": {
+                "city": {"type": "string"},
+                "zip": {"type": "string", "pattern": "^[0-9]{5}$"}
+            }
+        }
+    },
+    "properties": {
+        "name": {"type": ["string", "null"], "maxLength": 10},
+        "home": {"$ref": "#/definitions/address"},
+        "work": {"$ref": "#/definitions/address"},
+    },
+    "required": ["name"]
+}
+
+
+def test_store(tmp_path):
+    cache = CompileCache()
+    store = SchemaStore(tmp_path, cache=cache)
+    field = store.compile(SCHEMA, {'readonly': False}, name='')
+    key = cache.key(SCHEMA, {'readonly': False}, name='')
+    assert key in store
+    assert store.compile(SCHEMA, {'readonly': False}, name='') is field
+
+    # A new worker: empty cache, same directory.
+    cache = CompileCache()
+    worker = SchemaStore(tmp_path, cache=cache)
+    loaded = worker.compile(SCHEMA, {'readonly': False}, name='')
+    assert loaded is not field
+    assert cache.get(key) is loaded
+    assert loaded.fields['home'].fields['zip'].validators[0].match_object \
+        .pattern == '^[0-9]{5}$'
+
+    cstruct = {'name': None, 'home': {'zip': '1'}}
+    for deserialize in (field.get_node().deserialize,
+                        loaded.get_node().deserialize,
+                        loaded.get_deserializer()):
+        with pytest.raises(colander.Invalid) as exc:
+            deserialize(cstruct)
+        assert exc.value.asdict() == {
+            'home.zip': 'String does not match expected pattern'
+        }
+
+
+def test_versions(tmp_path):
+    old = SchemaStore(tmp_path, version='old', cache=None)
+    old.compile(SCHEMA, name='')
+    new = SchemaStore(tmp_path, version='new', cache=None)
+    key = CompileCache().key(SCHEMA, name='')
+    assert key in old
+    assert key not in new
+    new.compile(SCHEMA, name='')
+    assert new.prune() == 1
+    assert not (tmp_path / 'old').exists()
+    assert key in new
+
+
+def test_invalid_entries(tmp_path):
+    store = SchemaStore(tmp_path, cache=None)
+    key = CompileCache().key(SCHEMA, name='')
+    store.directory.mkdir(parents=True)
+    store.path(key).write_bytes(b'truncated')
+    assert store.get(key) is None
+    assert key not in store
+    assert store.compile(SCHEMA, name='').fields['name'].nullable is True
+    assert store.get(key) is not None
+
+    config = {'name': {'validators': [lambda node, value: None]}}
+    field = store.compile(SCHEMA, config, name='')
+    assert len(field.fields['name'].validators) == 2
+    with pytest.raises(UnstableKey):
+        CompileCache().key(SCHEMA, config, name='')
+    assert [entry.name for entry in store.directory.iterdir()] == [
+        f'{key}.pickle']